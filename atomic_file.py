@@ -0,0 +1,71 @@
+"""Atomic file replacement shared by the GUI, exporter and report tools."""
+
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+# os.umask can only be read by setting it, so sample it once at import time
+# rather than racing other threads on every write.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def _target_mode(path: Path) -> int:
+    """Permission bits the replacement should carry.
+
+    mkstemp creates files as 0600; keep an existing target's mode, or give a
+    new file the mode a plain open() would have produced.
+    """
+
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def replace_on_close(
+    path: Union[str, "os.PathLike[str]"],
+    *,
+    binary: bool = False,
+    newline: Optional[str] = None,
+    buffering: int = -1,
+) -> Iterator[IO[Any]]:
+    """Write *path* via a fsynced sibling temp file renamed over it on success.
+
+    The temp file gets a unique name, so concurrent writers to the same target
+    never share one, and the target's permission bits are carried over. A
+    failed write removes the temp file and leaves any existing file untouched.
+    """
+
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp_name, _target_mode(path))
+        if binary:
+            handle = os.fdopen(fd, "wb", buffering=buffering)
+        else:
+            handle = os.fdopen(
+                fd, "w", encoding="utf-8", newline=newline, buffering=buffering
+            )
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_name)
+        raise
+    try:
+        with handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -5,20 +5,57 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import sys
 import math
-from array import array
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Iterator, List, Sequence, Tuple
 
+import numpy as np
+
+from atomic_file import replace_on_close
+
 try:  # pragma: no cover - optional dependency for MP3 files
     import audioread
 except ImportError:  # pragma: no cover - handled lazily at runtime
     audioread = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional libsndfile reader for WAV files
+    import soundfile as sf
+except (ImportError, OSError):  # pragma: no cover - falls back to ``wave``
+    sf = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional ahead-of-time build of the activity kernel
+    from _ate_kernels import rms_activity as _aot_rms_activity
+except ImportError:  # pragma: no cover - falls back to numba or NumPy
+    _aot_rms_activity = None
+
+try:  # pragma: no cover - optional JIT for the activity kernel
+    from numba import njit
+except ImportError:  # pragma: no cover - falls back to the NumPy path
+    njit = None  # type: ignore[assignment]
+
 
 SUPPORTED_SUFFIXES = {".wav", ".mp3"}
+# Full-scale magnitude of signed 16-bit PCM, the only sample format accepted.
+_PEAK_16 = 32768.0
+# WAV and decoded MP3 PCM are little-endian; decoding with an explicit dtype
+# means big-endian hosts never need a separate byteswap pass.
+_PCM16_LE = np.dtype("<i2")
+# Target size, in samples, of the scratch arena used for streamed decoding.
+_ARENA_SAMPLES = 1 << 20
+# Samples widened per pass by the NumPy kernel; 256 KiB of int64 fits in L2.
+_TILE_SAMPLES = 1 << 15
+# Size of a canonical WAV header; smaller files cannot contain any samples.
+_MIN_AUDIO_BYTES = 44
+# WAVs up to this size are decoded in one read; larger captures are streamed
+# through the chunk arena so each worker's memory stays bounded however many
+# long recordings run in parallel.
+_WHOLE_FILE_MAX_BYTES = 64 << 20
 
 
 @dataclass
@@ -30,6 +67,25 @@ class AudioActivitySummary:
     duty_cycle_percent: float
 
 
+def _scan_audio_files(root: str, recursive: bool) -> Iterator[str]:
+    # os.scandir reports file types from the directory listing itself, so
+    # non-matching entries never cost a stat or a Path object.
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        # Unreadable directories are skipped, as Path.glob/rglob do.
+        return
+    with entries:
+        for entry in entries:
+            if recursive and entry.is_dir(follow_symlinks=False):
+                yield from _scan_audio_files(entry.path, recursive)
+            elif (
+                os.path.splitext(entry.name)[1].lower() in SUPPORTED_SUFFIXES
+                and entry.is_file()
+            ):
+                yield entry.path
+
+
 def discover_audio_files(paths: Sequence[Path], recursive: bool = False) -> List[Path]:
     """Return supported audio files from the provided paths."""
 
@@ -40,42 +96,105 @@ def discover_audio_files(paths: Sequence[Path], recursive: bool = False) -> List
             discovered.append(root)
             continue
         if root.is_dir():
-            iterator: Iterable[Path]
-            if recursive:
-                iterator = root.rglob("*")
-            else:
-                iterator = root.glob("*")
-            for candidate in iterator:
-                if candidate.is_file() and candidate.suffix.lower() in SUPPORTED_SUFFIXES:
-                    discovered.append(candidate.resolve())
+            for candidate in _scan_audio_files(str(root), recursive):
+                discovered.append(Path(candidate).resolve())
     return sorted(discovered)
 
 
-def _normalized_rms(chunk: bytes, sample_width: int) -> float:
-    if not chunk:
-        return 0.0
-
-    usable = len(chunk) - (len(chunk) % sample_width)
-    if usable <= 0:
-        return 0.0
+def _sum_squares(samples: np.ndarray) -> int:
+    """Return the exact sum of squares of an int16 sample block."""
+
+    # np.dot on int16 accumulates (and overflows) in int16, so let einsum
+    # widen each buffered block to int64 as it reduces instead of copying
+    # the whole input up front.
+    return int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+
+
+def _rms_activity_loop(samples, chunk_samples, threshold_full, threshold_tail):
+    """Return ``(total_samples, active_samples)`` for ``samples``.
+
+    Each full ``chunk_samples`` block is active when its sum of squares
+    reaches ``threshold_full``; a shorter trailing block is compared against
+    ``threshold_tail``. Both come from :func:`_chunk_thresholds`, so the inner
+    loop is a plain integer compare. This scalar form is only fast once
+    compiled, either by numba at import or ahead of time by compile_kernel.py.
+    """
+
+    total = samples.size
+    active = 0
+    for start in range(0, total, chunk_samples):
+        stop = min(start + chunk_samples, total)
+        ss = np.int64(0)
+        for i in range(start, stop):
+            value = np.int64(samples[i])
+            ss += value * value
+        limit = threshold_full if stop - start == chunk_samples else threshold_tail
+        if ss >= limit:
+            active += stop - start
+    return total, active
+
+
+if _aot_rms_activity is not None:  # pragma: no cover - built by compile_kernel.py
+    _rms_activity = _aot_rms_activity
+
+elif njit is not None:  # pragma: no cover - exercised only when numba is installed
+    _rms_activity = njit(cache=True, fastmath=True, boundscheck=False)(_rms_activity_loop)
+
+else:
+
+    def _rms_activity(samples, chunk_samples, threshold_full, threshold_tail):
+        """NumPy fallback with the same contract as :func:`_rms_activity_loop`."""
+
+        total = int(samples.size)
+        full_chunks = total // chunk_samples
+        split = full_chunks * chunk_samples
+        active_chunks = 0
+        if full_chunks:
+            # The reduction is memory-bound, so widen and score a tile of
+            # chunks at a time: the int64 copy (required, since a loud
+            # one-second chunk overflows int32) stays cache-sized instead of
+            # quadrupling the whole file. einsum fuses the multiply into the
+            # row reduction, so no squared copy is materialised either.
+            blocks = samples[:split].reshape(full_chunks, chunk_samples)
+            rows = max(1, _TILE_SAMPLES // chunk_samples)
+            for first in range(0, full_chunks, rows):
+                tile = blocks[first : first + rows].astype(np.int64)
+                sums = np.einsum("ij,ij->i", tile, tile)
+                active_chunks += int(np.count_nonzero(sums >= threshold_full))
+        active = active_chunks * chunk_samples
+        tail = samples[split:]
+        if tail.size and _sum_squares(tail) >= threshold_tail:
+            active += int(tail.size)
+        return total, active
+
+
+def _chunk_thresholds(
+    threshold: float, sample_width: int, chunk_samples: int, tail_samples: int = 0
+) -> Tuple[int, int]:
+    """Return integer sum-of-squares limits for full and trailing chunks."""
 
     if sample_width != 2:
         raise ValueError("Only 16-bit PCM is supported")
+    # rms / peak >= threshold  <=>  sum_squares >= (threshold * peak) ** 2 * N.
+    # Sums of squares are integers, so rounding the limit up keeps it exact.
+    per_sample = (threshold * _PEAK_16) ** 2
+    return (
+        math.ceil(per_sample * chunk_samples),
+        math.ceil(per_sample * tail_samples),
+    )
 
-    samples = array("h")
-    samples.frombytes(chunk[:usable])
-    if sys.byteorder == "big":
-        samples.byteswap()
 
-    if not samples:
-        return 0.0
+def _activity_seconds(
+    total_samples: int, active_samples: int, sample_rate: int
+) -> Tuple[float, float, float]:
+    if sample_rate <= 0:
+        raise ValueError("Sample rate must be positive")
 
-    peak = float(1 << (sample_width * 8 - 1))
-    sum_squares = 0.0
-    for sample in samples:
-        sum_squares += float(sample * sample)
-    rms = math.sqrt(sum_squares / len(samples)) if sum_squares else 0.0
-    return rms / peak
+    duration = total_samples / sample_rate if total_samples else 0.0
+    active = active_samples / sample_rate if active_samples else 0.0
+    duty = (active_samples / total_samples * 100.0) if total_samples else 0.0
+
+    return duration, active, duty
 
 
 def _measure_activity(
@@ -87,36 +206,131 @@ def _measure_activity(
 ) -> Tuple[float, float, float]:
     total_samples = 0
     active_samples = 0
-    chunk_bytes = max(sample_width, chunk_samples * sample_width)
-    pending = bytearray()
+    threshold_full, _ = _chunk_thresholds(threshold, sample_width, chunk_samples)
+    # Decoded blocks are copied into a fixed arena holding a whole number of
+    # chunks; each time it fills, every chunk in it is scored at once and the
+    # arena is reused from the start, so nothing is re-buffered or shifted.
+    capacity = max(1, _ARENA_SAMPLES // chunk_samples) * chunk_samples
+    arena = np.empty(capacity, dtype=np.int16)
+    fill = 0
+    carry = b""
 
     for raw in chunks:
         if not raw:
             continue
-        pending.extend(raw)
-        while len(pending) >= chunk_bytes:
-            block = bytes(pending[:chunk_bytes])
-            del pending[:chunk_bytes]
-            samples = len(block) // sample_width
-            total_samples += samples
-            if _normalized_rms(block, sample_width) >= threshold:
-                active_samples += samples
-
-    if pending:
-        block = bytes(pending)
-        samples = len(block) // sample_width
-        total_samples += samples
-        if _normalized_rms(block, sample_width) >= threshold:
-            active_samples += samples
-
+        if carry:
+            raw = carry + bytes(raw)
+            carry = b""
+        odd = len(raw) % sample_width
+        if odd:
+            carry = bytes(raw[-odd:])
+        incoming = np.frombuffer(raw, dtype=_PCM16_LE, count=len(raw) // sample_width)
+        while incoming.size:
+            take = min(capacity - fill, incoming.size)
+            arena[fill : fill + take] = incoming[:take]
+            fill += take
+            incoming = incoming[take:]
+            if fill == capacity:
+                total, active = _rms_activity(arena, chunk_samples, threshold_full, 0)
+                total_samples += total
+                active_samples += active
+                fill = 0
+
+    if fill:
+        # Only the final flush can end in a partial chunk.
+        tail = fill % chunk_samples
+        _, threshold_tail = _chunk_thresholds(threshold, sample_width, chunk_samples, tail)
+        total, active = _rms_activity(arena[:fill], chunk_samples, threshold_full, threshold_tail)
+        total_samples += total
+        active_samples += active
+
+    return _activity_seconds(total_samples, active_samples, sample_rate)
+
+
+def _check_wav_format(path: Path, wav_reader, sample_width: int) -> int:
+    """Validate an open ``wave`` reader as mono 16-bit PCM; return its rate."""
+
+    sample_rate = wav_reader.getframerate()
+    nchannels = wav_reader.getnchannels()
+    sampwidth = wav_reader.getsampwidth()
+    if nchannels != 1:
+        raise ValueError(f"{path} must be mono but has {nchannels} channels")
+    if sampwidth != sample_width:
+        raise ValueError(
+            f"{path} must be 16-bit PCM; got sample width {sampwidth}"
+        )
     if sample_rate <= 0:
-        raise ValueError("Sample rate must be positive")
+        raise ValueError(f"Invalid sample rate {sample_rate} for {path}")
+    return sample_rate
 
-    duration = total_samples / sample_rate if total_samples else 0.0
-    active = active_samples / sample_rate if active_samples else 0.0
-    duty = (active_samples / total_samples * 100.0) if total_samples else 0.0
 
-    return duration, active, duty
+def _stream_wav_activity(
+    path: Path, sample_width: int, threshold: float, chunk_ms: float
+) -> Tuple[int, float, float, float]:
+    """Measure a large WAV chunk by chunk in constant memory.
+
+    Returns ``(sample_rate, duration, active, duty)``.
+    """
+
+    import wave
+
+    with wave.open(str(path), "rb") as wav_reader:
+        sample_rate = _check_wav_format(path, wav_reader, sample_width)
+        chunk_samples = max(1, int(round(sample_rate * chunk_ms / 1000.0)))
+
+        def wav_iter() -> Iterator[bytes]:
+            while True:
+                raw = wav_reader.readframes(chunk_samples)
+                if not raw:
+                    break
+                yield raw
+
+        duration, active, duty = _measure_activity(
+            wav_iter(), sample_width, sample_rate, threshold, chunk_samples
+        )
+    return sample_rate, duration, active, duty
+
+
+def _read_wav_samples(path: Path, sample_width: int) -> Tuple[np.ndarray, int]:
+    """Return every sample of a mono 16-bit WAV file and its sample rate.
+
+    Only used for files up to :data:`_WHOLE_FILE_MAX_BYTES`, so the file is
+    read in a single pass. libsndfile decodes straight into a preallocated
+    array when ``soundfile`` is installed; otherwise the ``wave`` module is
+    used.
+    """
+
+    if sf is not None:
+        with sf.SoundFile(str(path)) as sound_file:
+            sample_rate = sound_file.samplerate
+            if sound_file.channels != 1:
+                raise ValueError(
+                    f"{path} must be mono but has {sound_file.channels} channels"
+                )
+            if sound_file.subtype != "PCM_16":
+                raise ValueError(
+                    f"{path} must be 16-bit PCM; got subtype {sound_file.subtype}"
+                )
+            if sample_rate <= 0:
+                raise ValueError(f"Invalid sample rate {sample_rate} for {path}")
+            samples = np.empty(sound_file.frames, dtype=np.int16)
+            read = sound_file.read(dtype="int16", out=samples)
+            return samples[: len(read)], sample_rate
+
+    import wave
+
+    with wave.open(str(path), "rb") as wav_reader:
+        sample_rate = _check_wav_format(path, wav_reader, sample_width)
+        raw = wav_reader.readframes(wav_reader.getnframes())
+        samples = np.frombuffer(raw, dtype=_PCM16_LE, count=len(raw) // sample_width)
+        return samples, sample_rate
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
 
 
 def analyze_audio_file(
@@ -133,35 +347,22 @@ def analyze_audio_file(
 
     sample_width = 2
 
-    if suffix == ".wav":
-        import wave
-
-        with wave.open(str(path), "rb") as wav_reader:
-            sample_rate = wav_reader.getframerate()
-            nchannels = wav_reader.getnchannels()
-            sampwidth = wav_reader.getsampwidth()
-            if nchannels != 1:
-                raise ValueError(f"{path} must be mono but has {nchannels} channels")
-            if sampwidth != sample_width:
-                raise ValueError(
-                    f"{path} must be 16-bit PCM; got sample width {sampwidth}"
-                )
-            if sample_rate <= 0:
-                raise ValueError(f"Invalid sample rate {sample_rate} for {path}")
-
-            chunk_samples = max(1, int(round(sample_rate * chunk_ms / 1000.0)))
-
-            def wav_iter() -> Iterator[bytes]:
-                wav_reader.rewind()
-                while True:
-                    raw = wav_reader.readframes(chunk_samples)
-                    if not raw:
-                        break
-                    yield raw
-
-            duration, active, duty = _measure_activity(
-                wav_iter(), sample_width, sample_rate, threshold, chunk_samples
-            )
+    if suffix == ".wav" and _file_size(path) > _WHOLE_FILE_MAX_BYTES:
+        sample_rate, duration, active, duty = _stream_wav_activity(
+            path, sample_width, threshold, chunk_ms
+        )
+    elif suffix == ".wav":
+        samples, sample_rate = _read_wav_samples(path, sample_width)
+        chunk_samples = max(1, int(round(sample_rate * chunk_ms / 1000.0)))
+        threshold_full, threshold_tail = _chunk_thresholds(
+            threshold, sample_width, chunk_samples, samples.size % chunk_samples
+        )
+        total_samples, active_samples = _rms_activity(
+            samples, chunk_samples, threshold_full, threshold_tail
+        )
+        duration, active, duty = _activity_seconds(
+            int(total_samples), int(active_samples), sample_rate
+        )
     else:
         if audioread is None:  # pragma: no cover - optional dependency
             raise ImportError(
@@ -199,14 +400,59 @@ def analyze_audio_file(
     )
 
 
+def iter_report(
+    paths: Sequence[Path],
+    threshold: float,
+    chunk_ms: float,
+    recursive: bool,
+    jobs: int | None = None,
+) -> Iterator[AudioActivitySummary]:
+    """Yield a summary per discovered file, fanning out across ``jobs`` processes.
+
+    ``jobs=None`` uses one worker per CPU; ``jobs=1`` keeps everything in the
+    calling process. Summaries are yielded in discovery (path) order as soon
+    as they are ready, so callers never need to hold the full report. Files
+    too small to hold any audio are skipped without being opened.
+    """
+
+    if jobs is not None and jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    sizes = {
+        path: size
+        for path in discover_audio_files(paths, recursive=recursive)
+        if (size := _file_size(path)) >= _MIN_AUDIO_BYTES
+    }
+    audio_files = list(sizes)
+    analyze = partial(analyze_audio_file, threshold=threshold, chunk_ms=chunk_ms)
+    workers = min(jobs or os.cpu_count() or 1, len(audio_files))
+    if workers <= 1:
+        for path in audio_files:
+            yield analyze(path)
+        return
+
+    # Submit the largest files first (longest-processing-time scheduling) so a
+    # big recording picked up last cannot leave one worker running alone, but
+    # still yield in path order to keep the report deterministic.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            path: executor.submit(analyze, path)
+            for path in sorted(audio_files, key=sizes.__getitem__, reverse=True)
+        }
+        for path in audio_files:
+            yield futures[path].result()
+
+
 def generate_report(
-    paths: Sequence[Path], threshold: float, chunk_ms: float, recursive: bool
+    paths: Sequence[Path],
+    threshold: float,
+    chunk_ms: float,
+    recursive: bool,
+    jobs: int | None = None,
 ) -> List[AudioActivitySummary]:
-    audio_files = discover_audio_files(paths, recursive=recursive)
-    return [analyze_audio_file(path, threshold=threshold, chunk_ms=chunk_ms) for path in audio_files]
+    return list(iter_report(paths, threshold, chunk_ms, recursive, jobs=jobs))
 
 
-def _write_csv(rows: Sequence[AudioActivitySummary], output: Path | None) -> None:
+def _write_rows(handle, rows: Iterable[AudioActivitySummary]) -> None:
     fieldnames = [
         "path",
         "sample_rate_hz",
@@ -215,23 +461,41 @@ def _write_csv(rows: Sequence[AudioActivitySummary], output: Path | None) -> Non
         "duty_cycle_percent",
     ]
 
-    handle = sys.stdout if output is None else output.open("w", newline="", encoding="utf-8")
+    writer = csv.DictWriter(handle, fieldnames=fieldnames)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {
+                "path": str(row.path),
+                "sample_rate_hz": row.sample_rate,
+                "duration_seconds": f"{row.duration_seconds:.3f}",
+                "active_seconds": f"{row.active_seconds:.3f}",
+                "duty_cycle_percent": f"{row.duty_cycle_percent:.2f}",
+            }
+        )
+
+
+def _write_csv(rows: Iterable[AudioActivitySummary], output: Path | None) -> None:
+    if output is None:
+        _write_rows(sys.stdout, rows)
+        return
+
+    # Stream rows into a sibling temp file renamed over the target so a crash
+    # never leaves a truncated report behind.
+    with replace_on_close(output, newline="") as handle:
+        _write_rows(handle, rows)
+
+
+def _positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1."""
+
     try:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "path": str(row.path),
-                    "sample_rate_hz": row.sample_rate,
-                    "duration_seconds": f"{row.duration_seconds:.3f}",
-                    "active_seconds": f"{row.active_seconds:.3f}",
-                    "duty_cycle_percent": f"{row.duty_cycle_percent:.2f}",
-                }
-            )
-    finally:
-        if output is not None:
-            handle.close()
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
 
 
 def main() -> None:  # pragma: no cover - CLI wrapper
@@ -261,13 +525,29 @@ def main() -> None:  # pragma: no cover - CLI wrapper
         help="Optional CSV output path. Defaults to audio_duty_cycle.csv.",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes. Defaults to the CPU count; use 1 to run serially.",
+    )
+
     args = parser.parse_args()
 
-    rows = generate_report(args.paths, args.threshold, args.chunk_ms, recursive=args.recursive)
-    if not rows:
+    rows = iter_report(
+        args.paths,
+        args.threshold,
+        args.chunk_ms,
+        recursive=args.recursive,
+        jobs=args.jobs,
+    )
+    # Pull the first summary before touching the output so an empty scan
+    # neither clobbers an existing report nor writes a header-only file.
+    first = next(rows, None)
+    if first is None:
         raise SystemExit("No supported audio files were found.")
 
-    _write_csv(rows, args.output)
+    _write_csv(itertools.chain((first,), rows), args.output)
 
 
 if __name__ == "__main__":  # pragma: no cover
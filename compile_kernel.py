@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Ahead-of-time compile the audio activity kernel with numba.
+
+Running this script builds an ``_ate_kernels`` extension module next to it.
+``audio_activity_report.py`` imports that module when present, which avoids
+the JIT compile that would otherwise run on the first report of every
+process. Rebuild after upgrading Python or NumPy.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from audio_activity_report import _rms_activity_loop
+
+
+def main() -> None:
+    cc = CC("_ate_kernels")
+    cc.output_dir = str(Path(__file__).resolve().parent)
+    cc.verbose = True
+    cc.export("rms_activity", "UniTuple(i8, 2)(i2[:], i8, i8, i8)")(_rms_activity_loop)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,19 +8,24 @@ import time
 import wave
 from pathlib import Path
 
-import numpy as np
 
-from multich_nbfm_tx import MultiNBFMTx
+_ZERO_CHUNK = bytes(65536)
 
 
 def _write_silence_wav(path: Path, sample_rate: int, duration: float) -> None:
     total_frames = max(1, int(sample_rate * duration))
-    silence = np.zeros(total_frames, dtype=np.int16)
+    remaining = total_frames * 2
+    zeros = memoryview(_ZERO_CHUNK)
     with wave.open(str(path), "wb") as wav:
         wav.setnchannels(1)
         wav.setsampwidth(2)
         wav.setframerate(sample_rate)
-        wav.writeframes(silence.tobytes())
+        # Stream a fixed zero block instead of materialising the whole clip;
+        # the header is patched with the final length when the file closes.
+        while remaining:
+            count = min(len(zeros), remaining)
+            wav.writeframesraw(zeros[:count])
+            remaining -= count
 
 
 def parse_args() -> argparse.Namespace:
@@ -72,22 +77,29 @@ def parse_args() -> argparse.Namespace:
         ),
     )
     parser.add_argument("--master-scale", type=float, default=0.8, help="Master amplitude scaling applied to the composite signal")
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress the configuration summary and status messages",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
 
+    # Imported here so --help and argument errors do not pay for loading
+    # GNU Radio and osmosdr.
+    from multich_nbfm_tx import MultiNBFMTx, resolve_device_args
+
     if args.ctcss_level <= 0:
         raise SystemExit("--ctcss-level must be positive")
     if args.ctcss_deviation is not None and args.ctcss_deviation <= 0:
         raise SystemExit("--ctcss-deviation must be positive")
-    if args.device_args and args.pluto_ip:
-        raise SystemExit("--device-args and --pluto-ip cannot be used together")
-    if args.pluto_ip:
-        if args.device.lower() not in {"pluto", "plutoplus", "pluto+", "plutoplussdr"}:
-            raise SystemExit("--pluto-ip is only valid with --device pluto or plutoplus")
-        args.device_args = f"pluto=ip:{args.pluto_ip}"
+    try:
+        args.device_args = resolve_device_args(args.device, args.device_args, args.pluto_ip)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
 
     silence_sr = 48_000
 
@@ -115,13 +127,15 @@ def main() -> None:
             ctcss_deviation=args.ctcss_deviation,
         )
 
-        tx.print_configuration_summary()
+        if not args.quiet:
+            tx.print_configuration_summary()
 
         tx.start()
-        print(
-            "Transmitting continuous CTCSS tone on channel 1. Press Ctrl-C to stop, "
-            "or wait for the requested duration."
-        )
+        if not args.quiet:
+            print(
+                "Transmitting continuous CTCSS tone on channel 1. Press Ctrl-C to stop, "
+                "or wait for the requested duration."
+            )
 
         start = time.time()
         try:
@@ -0,0 +1,10 @@
+"""Audio gate defaults shared by the transmitter and the GUI.
+
+Kept free of third-party imports so the GUI can read them without pulling in
+the GNU Radio flowgraph module.
+"""
+
+DEFAULT_GATE_OPEN_THRESHOLD = 0.015
+DEFAULT_GATE_CLOSE_THRESHOLD = 0.014
+DEFAULT_GATE_ATTACK_MS = 4.0
+DEFAULT_GATE_RELEASE_MS = 200.0
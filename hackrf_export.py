@@ -3,14 +3,45 @@
 from __future__ import annotations
 
 import csv
+import errno
+import filecmp
 import json
+import os
 import shutil
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from atomic_file import replace_on_close
 
-@dataclass
+try:  # pragma: no cover - optional faster JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+if sys.platform == "win32":  # pragma: no cover - Windows only
+    import ctypes
+    from ctypes import wintypes
+
+    _CopyFileExW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    _CopyFileExW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.POINTER(wintypes.BOOL),
+        wintypes.DWORD,
+    ]
+    _CopyFileExW.restype = wintypes.BOOL
+else:
+    _CopyFileExW = None
+
+
+@dataclass(slots=True, frozen=True)
 class HackRFExportChannel:
     """Represents one channel worth of audio and metadata for export."""
 
@@ -22,28 +53,211 @@ class HackRFExportChannel:
     dcs_code: Optional[str] = None
 
 
-def _copy_once(src: Path, dest_dir: Path, name_map: Dict[Path, str]) -> Path:
-    """Copy *src* into *dest_dir* only once and return a relative path.
+_COPY_BUFFER_SIZE = 1 << 20
+_MAX_COPY_WORKERS = 8
+_MANIFEST_BUFFER_SIZE = 1 << 20
+# Copy workers each keep one fallback buffer for the life of the thread
+# rather than allocating a fresh megabyte per file.
+_copy_buffers = threading.local()
+
+# Unbuffered copies skip the Windows cache manager, which only pays off for
+# files large enough that caching them would evict more useful data.
+_COPY_FILE_NO_BUFFERING = 0x00001000
+_NO_BUFFERING_MIN_SIZE = 16 << 20
+
+# errno values meaning "this kernel copy primitive does not apply to these
+# descriptors"; anything else is a genuine I/O error and is re-raised.
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EBADF,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+}
+
+# Kernel copy primitives, resolved once; a primitive is dropped for the rest
+# of the process the first time the kernel reports it as unimplemented.
+_copy_file_range = getattr(os, "copy_file_range", None)
+_sendfile = getattr(os, "sendfile", None)
+
+
+def _copy_complete(copied: int, size: int) -> bool:
+    """Check a kernel copy loop that stopped at *copied* of *size* bytes.
+
+    A primitive that reports EOF before moving any data (some pseudo and FUSE
+    filesystems do) just doesn't apply, so the next method is tried. Stopping
+    part way leaves a truncated destination and is an error.
+    """
+
+    if copied == size:
+        return True
+    if copied:
+        raise OSError(
+            errno.EIO, f"short kernel copy: {copied} of {size} bytes written"
+        )
+    return False
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy *size* bytes inside the kernel, returning ``False`` if unsupported.
+
+    ``copy_file_range`` lets CoW and network filesystems clone or copy
+    server-side; ``sendfile`` still avoids bouncing data through user space.
+    Either one reporting EOF before the first byte falls through to the next.
+    """
+
+    global _copy_file_range, _sendfile
+
+    copy_file_range = _copy_file_range
+    if copy_file_range is not None:
+        copied = 0
+        try:
+            while copied < size:
+                sent = copy_file_range(src_fd, dst_fd, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError as exc:
+            if copied or exc.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            if exc.errno == errno.ENOSYS:
+                _copy_file_range = None
+        else:
+            if _copy_complete(copied, size):
+                return True
+
+    sendfile = _sendfile
+    if sendfile is not None:
+        copied = 0
+        try:
+            while copied < size:
+                sent = sendfile(dst_fd, src_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError as exc:
+            if copied or exc.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            if exc.errno == errno.ENOSYS:
+                _sendfile = None
+        else:
+            if _copy_complete(copied, size):
+                return True
+
+    return False
+
+
+def _copy_view() -> memoryview:
+    """Return this thread's reusable fallback copy buffer."""
+
+    view = getattr(_copy_buffers, "view", None)
+    if view is None:
+        view = _copy_buffers.view = memoryview(bytearray(_COPY_BUFFER_SIZE))
+    return view
+
+
+def _fast_copy(src: Path, dst: Path, size: Optional[int] = None) -> None:
+    """Copy *src* to *dst* with data and metadata, like :func:`shutil.copy2`.
+
+    *size* may carry the source size from an earlier ``stat`` to skip the
+    ``fstat`` here.
+    """
+
+    if _CopyFileExW is not None:  # pragma: no cover - Windows only
+        # CopyFileExW copies inside the OS (offloaded or CoW on ReFS/SMB3);
+        # on failure fall through to the portable loop below.
+        if size is None:
+            size = os.stat(src).st_size
+        flags = _COPY_FILE_NO_BUFFERING if size >= _NO_BUFFERING_MIN_SIZE else 0
+        if _CopyFileExW(os.fspath(src), os.fspath(dst), None, None, None, flags):
+            shutil.copystat(src, dst)
+            return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if size is None:
+            size = os.fstat(fsrc.fileno()).st_size
+        if not _kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+            view = _copy_view()
+            while True:
+                count = fsrc.readinto(view)
+                if not count:
+                    break
+                fdst.write(view[:count])
+    shutil.copystat(src, dst)
+
+
+def _matches_existing(src: Path, src_stat: os.stat_result, dest: Path) -> bool:
+    """Return ``True`` if *dest* already holds an up-to-date copy of *src*.
+
+    Either it is the very same file, or it has the size and modification time
+    that :func:`shutil.copystat` gave an earlier export's copy and the same
+    bytes. Size and mtime alone are not proof: fixed-length generated clips
+    or archives extracted with their timestamps can share both.
+    """
+
+    try:
+        dest_stat = os.stat(dest)
+    except OSError:
+        return False
+    if (dest_stat.st_dev, dest_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+        return True
+    if (
+        dest_stat.st_size != src_stat.st_size
+        or dest_stat.st_mtime_ns != src_stat.st_mtime_ns
+    ):
+        return False
+    try:
+        return filecmp.cmp(src, dest, shallow=False)
+    except OSError:
+        return False
+
+
+def _reserve_name(
+    src: Path,
+    src_stat: os.stat_result,
+    audio_dir: Path,
+    name_map: Dict[str, str],
+    taken: Set[str],
+    existing: Set[str],
+    realpaths: Dict[str, str],
+) -> Tuple[str, bool]:
+    """Pick the export name for *src* and return its relative path.
 
     The returned path is relative to the final export root ("audio/<name>")
-    so it can be stored directly in playlist manifests.
+    so it can be stored directly in playlist manifests. The flag is ``True``
+    when the caller still has to copy the file: not for repeats within this
+    export, nor when a previous export already left an identical copy under
+    a name in *existing*, which is then claimed instead of duplicated.
+    *taken* starts out as the names already in the export's audio folder and
+    every reserved name is added to it, so copies can run concurrently.
+    *realpaths* memoises symlink resolution for sources repeated across
+    playlists.
     """
 
-    resolved = src.resolve()
-    if resolved in name_map:
-        return Path("audio") / name_map[resolved]
+    raw = os.fspath(src)
+    resolved = realpaths.get(raw)
+    if resolved is None:
+        resolved = realpaths[raw] = os.path.realpath(raw)
+    name = name_map.get(resolved)
+    if name is not None:
+        return f"audio/{name}", False
 
     stem = src.stem
     suffix = src.suffix
     candidate = src.name
     counter = 1
-    while (dest_dir / candidate).exists():
+    while candidate in taken:
+        if candidate in existing and _matches_existing(src, src_stat, audio_dir / candidate):
+            existing.discard(candidate)
+            name_map[resolved] = candidate
+            return f"audio/{candidate}", False
         counter += 1
         candidate = f"{stem}_{counter}{suffix}"
 
-    shutil.copy2(src, dest_dir / candidate)
+    taken.add(candidate)
     name_map[resolved] = candidate
-    return Path("audio") / candidate
+    return f"audio/{candidate}", True
 
 
 def export_hackrf_package(
@@ -73,11 +287,17 @@ def export_hackrf_package(
     if not channels:
         raise ValueError("At least one channel is required for export")
 
-    destination.mkdir(parents=True, exist_ok=True)
     audio_dir = destination / "audio"
-    audio_dir.mkdir(exist_ok=True)
 
-    name_map: Dict[Path, str] = {}
+    name_map: Dict[str, str] = {}
+    realpaths: Dict[str, str] = {}
+    # One directory read replaces a stat per candidate name.
+    try:
+        existing: Set[str] = set(os.listdir(audio_dir))
+    except FileNotFoundError:
+        existing = set()
+    taken: Set[str] = set(existing)
+    copies: List[Tuple[Path, Path, int]] = []
     manifest_channels: List[Dict[str, object]] = []
 
     for channel in channels:
@@ -86,16 +306,24 @@ def export_hackrf_package(
         file_entries: List[str] = []
         for src in channel.playlist:
             src_path = Path(src)
-            if not src_path.exists():
+            # One stat answers both "does it exist" and "is it a regular
+            # file", and its size is reused by the copy below.
+            try:
+                st = os.stat(src_path)
+            except OSError:
                 raise FileNotFoundError(
                     f"Audio file for channel {channel.index} is missing: {src_path}"
-                )
-            if not src_path.is_file():
+                ) from None
+            if not stat.S_ISREG(st.st_mode):
                 raise FileNotFoundError(
                     f"Audio path for channel {channel.index} is not a file: {src_path}"
                 )
-            rel_path = _copy_once(src_path, audio_dir, name_map)
-            file_entries.append(str(rel_path))
+            rel_path, is_new = _reserve_name(
+                src_path, st, audio_dir, name_map, taken, existing, realpaths
+            )
+            if is_new:
+                copies.append((src_path, destination / rel_path, st.st_size))
+            file_entries.append(rel_path)
 
         manifest_channels.append(
             {
@@ -108,6 +336,23 @@ def export_hackrf_package(
             }
         )
 
+    # Every source has been validated and named before anything is written,
+    # so a bad playlist entry no longer leaves a partial export behind.
+    audio_dir.mkdir(parents=True, exist_ok=True)
+
+    # Only the byte copies run in parallel; they spend their time in
+    # syscalls that release the GIL. Largest files go first so short ones
+    # fill in the tail instead of one big copy finishing alone.
+    copies.sort(key=lambda item: item[2], reverse=True)
+    if copies:
+        workers = min(_MAX_COPY_WORKERS, (os.cpu_count() or 1) * 2, len(copies))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_fast_copy, src, dst, size) for src, dst, size in copies
+            ]
+            for future in futures:
+                future.result()
+
     manifest = {
         "center_frequency_hz": center_frequency_hz,
         "tx_sample_rate": tx_sample_rate,
@@ -125,25 +370,32 @@ def export_hackrf_package(
     }
 
     json_path = destination / "hackrf_playlist.json"
-    json_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # orjson serialises straight to UTF-8 bytes, several times faster
+        # than the stdlib encoder, with the same two-space layout.
+        with replace_on_close(json_path, binary=True) as handle:
+            handle.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with replace_on_close(json_path, buffering=_MANIFEST_BUFFER_SIZE) as handle:
+            json.dump(manifest, handle, indent=2)
 
     csv_path = destination / "hackrf_playlist.csv"
-    with csv_path.open("w", newline="", encoding="utf-8") as handle:
-        fieldnames = [
-            "index",
-            "frequency_hz",
-            "gain",
-            "ctcss_hz",
-            "dcs_code",
-            "files",
-        ]
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for entry in manifest_channels:
-            writer.writerow({
-                **entry,
-                "files": ";".join(entry["files"]),
-            })
+    with replace_on_close(csv_path, newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["index", "frequency_hz", "gain", "ctcss_hz", "dcs_code", "files"])
+        # Plain tuples skip DictWriter's per-row field lookups; csv still
+        # handles quoting, and None is written as an empty cell as before.
+        writer.writerows(
+            (
+                entry["index"],
+                entry["frequency_hz"],
+                entry["gain"],
+                entry["ctcss_hz"],
+                entry["dcs_code"],
+                ";".join(entry["files"]),
+            )
+            for entry in manifest_channels
+        )
 
     return json_path
 
@@ -2,28 +2,64 @@
 """Lightweight GUI wrapper for the multi-channel NBFM transmitter."""
 
 import argparse
-import contextlib
+import collections
 import csv
+import functools
 import importlib
+import itertools
 import json
 import math
+import os
+import re
+import struct
+import sys
 import threading
 import time
 import tkinter as tk
+import types
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
-from typing import Dict, List, Optional, Sequence
-import wave
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-from multich_nbfm_tx import (
+from atomic_file import replace_on_close
+from gate_defaults import (
     DEFAULT_GATE_ATTACK_MS,
     DEFAULT_GATE_CLOSE_THRESHOLD,
     DEFAULT_GATE_OPEN_THRESHOLD,
     DEFAULT_GATE_RELEASE_MS,
-    MultiNBFMTx,
 )
-from hackrf_export import HackRFExportChannel, export_hackrf_package
+
+if sys.platform.startswith("linux"):  # pragma: no cover - Linux only
+    try:
+        import liburing
+    except ImportError:  # pragma: no cover - falls back to the thread pool
+        liburing = None  # type: ignore[assignment]
+else:  # pragma: no cover - io_uring is Linux only
+    liburing = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib codec
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from hackrf_export import HackRFExportChannel
+    from multich_nbfm_tx import MultiNBFMTx
 
 
 DEFAULT_TX_SAMPLE_RATE = 8_000_000
@@ -171,6 +207,13 @@ TRANSMITTER_SETTING_FIELDS = [
     ),
 ]
 
+# (key, name, allow_empty) per field, flattened once for the validation loops.
+_TX_FIELDS_FLAT: Tuple[Tuple[str, str, bool], ...] = tuple(
+    (field["key"], field["name"], bool(field.get("allow_empty")))
+    for field in TRANSMITTER_SETTING_FIELDS
+)
+_TX_NULLABLE_KEYS = frozenset(key for key, _name, allow_empty in _TX_FIELDS_FLAT if allow_empty)
+
 DEFAULT_TRANSMITTER_SETTINGS: Dict[str, Optional[float]] = {
     "tx_sample_rate": DEFAULT_TX_SAMPLE_RATE,
     "mod_sample_rate": DEFAULT_MOD_SAMPLE_RATE,
@@ -186,35 +229,65 @@ DEFAULT_TRANSMITTER_SETTINGS: Dict[str, Optional[float]] = {
 }
 
 
+@functools.lru_cache(maxsize=128)
 def _format_setting_value(value: Optional[float]) -> str:
+    # Equal numbers (1, 1.0) share a cache slot, which is fine because they
+    # format identically.
     return "" if value is None else f"{float(value):g}"
 
 
 def load_transmitter_settings(path: Path = TRANSMITTER_SETTINGS_PATH) -> Dict[str, Optional[float]]:
     """Load saved transmitter defaults from disk."""
 
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return dict(DEFAULT_TRANSMITTER_SETTINGS)
+    except OSError as exc:
+        raise ValueError(f"Unable to load transmitter settings from {path}: {exc}") from exc
+    return dict(_load_settings_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode JSON bytes, via orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib exception either way.
+    """
+
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode *obj* as two-space indented UTF-8 JSON, via orjson when available."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_settings_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Mapping[str, Optional[float]]:
+    """Parse and validate a settings file once per (path, mtime, size)."""
+
+    path = Path(path_str)
     settings = dict(DEFAULT_TRANSMITTER_SETTINGS)
-    if not path.exists():
-        return settings
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        raw = path.read_bytes()
+        data = _json_loads(raw)
     except (OSError, json.JSONDecodeError) as exc:
         raise ValueError(f"Unable to load transmitter settings from {path}: {exc}") from exc
     if not isinstance(data, dict):
         raise ValueError(f"Transmitter settings in {path} must be a JSON object")
 
-    allow_empty_keys = {
-        field["key"]
-        for field in TRANSMITTER_SETTING_FIELDS
-        if field.get("allow_empty")
-    }
     for key in settings.keys():
         if key not in data:
             continue
         raw_value = data[key]
         if raw_value is None:
-            if key in allow_empty_keys:
+            if key in _TX_NULLABLE_KEYS:
                 settings[key] = None
                 continue
             raise ValueError(f"Transmitter setting '{key}' cannot be null")
@@ -222,19 +295,36 @@ def load_transmitter_settings(path: Path = TRANSMITTER_SETTINGS_PATH) -> Dict[st
             settings[key] = float(raw_value)
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid value for '{key}' in {path}: {raw_value!r}") from exc
-    return settings
+    return types.MappingProxyType(settings)
 
 
 def save_transmitter_settings(
-    settings: Dict[str, Optional[float]], path: Path = TRANSMITTER_SETTINGS_PATH
+    settings: Dict[str, Optional[float]],
+    path: Path = TRANSMITTER_SETTINGS_PATH,
+    *,
+    atomic: bool = False,
 ) -> None:
-    """Persist transmitter defaults to disk."""
+    """Persist transmitter defaults to disk.
+
+    Incidental writes go straight to the file. Pass ``atomic=True`` for user
+    initiated saves to go through a fsynced temp file renamed over the target
+    instead, at the cost of the extra syscalls. NaN and infinity are rejected because orjson would
+    write them as ``null``, which the loader refuses for most keys.
+    """
 
     serializable: Dict[str, Optional[float]] = {}
     for key in DEFAULT_TRANSMITTER_SETTINGS.keys():
-        serializable[key] = settings.get(key)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(serializable, handle, indent=2)
+        value = settings.get(key)
+        if value is not None and not math.isfinite(value):
+            raise ValueError(f"Transmitter setting '{key}' must be finite, got {value!r}")
+        serializable[key] = value
+    payload = _json_dumps(serializable)
+    _load_settings_cached.cache_clear()
+    if not atomic:
+        path.write_bytes(payload)
+        return
+    with replace_on_close(path, binary=True) as handle:
+        handle.write(payload)
 
 
 @dataclass(frozen=True)
@@ -247,6 +337,47 @@ class ChannelPreset:
     ctcss_hz: Optional[float] = None
     dcs_code: Optional[str] = None
 
+    @functools.cached_property
+    def csv_values(self) -> Tuple[str, str, str, str, str]:
+        """The preset's CSV fields, formatted once per instance."""
+
+        # cached_property writes straight to __dict__, so it works on a
+        # frozen dataclass without object.__setattr__.
+        return (
+            self.key,
+            self.label,
+            f"{self.frequency_hz}",
+            "" if self.ctcss_hz is None else f"{self.ctcss_hz}",
+            self.dcs_code or "",
+        )
+
+
+@dataclass(frozen=True)
+class PresetIndex:
+    """Label lookups for a preset list, shared by every channel row.
+
+    The fields the rows read are stored as parallel tuples addressed through
+    ``positions`` rather than as ``ChannelPreset`` objects.
+    """
+
+    labels: Tuple[str, ...]
+    positions: Mapping[str, int]
+    frequencies: Tuple[float, ...]
+    ctcss: Tuple[Optional[float], ...]
+    dcs: Tuple[Optional[str], ...]
+
+    @classmethod
+    def from_presets(cls, presets: Sequence[ChannelPreset]) -> "PresetIndex":
+        return cls(
+            labels=tuple(preset.label for preset in presets),
+            positions=types.MappingProxyType(
+                {preset.label: idx for idx, preset in enumerate(presets)}
+            ),
+            frequencies=tuple(preset.frequency_hz for preset in presets),
+            ctcss=tuple(preset.ctcss_hz for preset in presets),
+            dcs=tuple(preset.dcs_code for preset in presets),
+        )
+
 
 @dataclass
 class PlaylistEntry:
@@ -280,6 +411,318 @@ def _get_mp3_loader():
     return _MP3_CLASS
 
 
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAVE_FORMAT_PCM = 1
+_RIFF_MAX_SIZE = 1 << 32
+
+
+def _read_wav_meta(path: Path) -> Optional[Tuple[Optional[float], int]]:
+    """Read duration and rate from a canonical 44-byte PCM WAV header.
+
+    Returns ``None`` when the file uses any other layout (extensible or
+    non-PCM formats, extra chunks before ``data``, RF64) so the caller can
+    fall back to the ``wave`` module.
+    """
+
+    with open(path, "rb", buffering=0) as handle:
+        header = handle.read(_WAV_HEADER.size)
+    return _parse_wav_header(header)
+
+
+def _parse_wav_header(header: bytes) -> Optional[Tuple[Optional[float], int]]:
+    if len(header) < _WAV_HEADER.size:
+        return None
+    (
+        riff,
+        _riff_size,
+        wave_id,
+        fmt_id,
+        fmt_size,
+        format_tag,
+        _channels,
+        rate,
+        _byte_rate,
+        block_align,
+        _bits,
+        data_id,
+        data_size,
+    ) = _WAV_HEADER.unpack(header)
+    if (
+        riff != b"RIFF"
+        or wave_id != b"WAVE"
+        or fmt_id != b"fmt "
+        or fmt_size != 16
+        or format_tag != _WAVE_FORMAT_PCM
+        or data_id != b"data"
+        or not block_align
+    ):
+        return None
+    frames = data_size // block_align
+    return (frames / rate if rate else None), rate
+
+
+_URING_DEPTH = 64
+_URING_UNAVAILABLE = False
+
+
+def _uring_round(
+    ring,
+    cqe,
+    ops: Sequence[Tuple[int, object]],
+    prep,
+    results: Optional[Dict[int, int]] = None,
+) -> Dict[int, int]:
+    """Queue one operation per ``(tag, arg)``, submit them together and reap.
+
+    Returns each tag's result, with failures (negative ``res``) mapped to -1.
+    Results are collected into *results* when given, so a caller still sees
+    the completions reaped before an error.
+    """
+
+    for tag, arg in ops:
+        sqe = liburing.io_uring_get_sqe(ring)
+        prep(sqe, arg)
+        sqe.user_data = tag
+    if results is None:
+        results = {}
+    if not ops:
+        return results
+    liburing.io_uring_submit_and_wait(ring, len(ops))
+    while len(results) < len(ops):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        entry = cqe[0]
+        try:
+            res = entry.res
+        except OSError:
+            res = -1
+        results[entry.user_data] = res
+        liburing.io_uring_cqe_seen(ring, entry)
+    return results
+
+
+def _probe_wav_headers_uring(
+    paths: Sequence[Path],
+) -> Optional[List[Optional[Tuple[Optional[float], int]]]]:
+    """Batch the WAV header probe through io_uring on Linux.
+
+    Every WAV in a batch is opened, read and closed with one submission per
+    stage, so a dialog selection costs three ``io_uring_enter`` calls per
+    :data:`_URING_DEPTH` files instead of three syscalls per file. Entries
+    that could not be parsed (MP3s, unusual layouts, unreadable files) are
+    ``None``; the whole result is ``None`` when io_uring is unavailable or
+    the batch fails part way, so the caller falls back to the thread pool.
+    """
+
+    global _URING_UNAVAILABLE
+    if liburing is None or _URING_UNAVAILABLE:
+        return None
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(_URING_DEPTH, ring)
+    except OSError:
+        # Kernels or sandboxes without io_uring; don't retry every dialog.
+        _URING_UNAVAILABLE = True
+        return None
+
+    def prep_open(sqe, path):
+        try:
+            liburing.io_uring_prep_open(sqe, os.fsencode(path), liburing.O_RDONLY)
+        except TypeError:
+            # Newer bindings take the path object itself rather than bytes.
+            liburing.io_uring_prep_open(sqe, path, liburing.O_RDONLY)
+
+    def prep_read(sqe, target):
+        fd, buf = target
+        liburing.io_uring_prep_read(sqe, fd, buf, 0)
+
+    metas: List[Optional[Tuple[Optional[float], int]]] = [None] * len(paths)
+    wavs = [idx for idx, path in enumerate(paths) if path.suffix.lower() == ".wav"]
+    opened: Dict[int, int] = {}
+    try:
+        for start in range(0, len(wavs), _URING_DEPTH):
+            batch = wavs[start : start + _URING_DEPTH]
+            opened = {}
+            _uring_round(
+                ring, cqe, [(idx, paths[idx]) for idx in batch], prep_open, opened
+            )
+            fds = {idx: fd for idx, fd in opened.items() if fd >= 0}
+            buffers = {idx: bytearray(_WAV_HEADER.size) for idx in fds}
+            read = _uring_round(
+                ring,
+                cqe,
+                [(idx, (fd, buffers[idx])) for idx, fd in fds.items()],
+                prep_read,
+            )
+            # Hand the descriptors to the close round before submitting it: once
+            # the kernel closes one, its number may be reused by another thread,
+            # so only closes that were never reaped are retried below.
+            opened = {}
+            closed: Dict[int, int] = {}
+            try:
+                _uring_round(
+                    ring, cqe, list(fds.items()), liburing.io_uring_prep_close, closed
+                )
+            except Exception:
+                opened = {idx: fd for idx, fd in fds.items() if idx not in closed}
+                raise
+            for idx, count in read.items():
+                if count > 0:
+                    metas[idx] = _parse_wav_header(bytes(buffers[idx][:count]))
+    except Exception:
+        return None
+    finally:
+        # Anything still in ``opened`` was not closed through the ring.
+        for fd in opened.values():
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        liburing.io_uring_queue_exit(ring)
+    return metas
+
+
+@functools.lru_cache(maxsize=1024)
+def _probe_audio(
+    path_str: str, size: int, mtime_ns: int
+) -> Tuple[Optional[float], Optional[int]]:
+    """Return ``(duration, sample_rate)`` for an audio file revision.
+
+    ``size`` and ``mtime_ns`` key the cache, so re-adding an unchanged file
+    skips the header parse while an edited file is probed again.
+    """
+
+    path = Path(path_str)
+    duration: Optional[float] = None
+    sample_rate: Optional[int] = None
+    if path.suffix.lower() == ".wav":
+        try:
+            meta = _read_wav_meta(path)
+        except OSError:
+            meta = None
+        if meta is not None:
+            return meta
+        if size >= _RIFF_MAX_SIZE:
+            # Past the 32-bit RIFF limit the file has to be RF64 (or
+            # corrupt), which the wave module cannot parse.
+            return None, None
+        try:
+            import wave
+
+            with wave.open(path_str, "rb") as wav_file:
+                frames = wav_file.getnframes()
+                rate = wav_file.getframerate()
+                sample_rate = rate
+                duration = frames / rate if rate else None
+        except Exception:
+            duration = None
+            sample_rate = None
+    elif path.suffix.lower() == ".mp3":
+        mp3_loader = _get_mp3_loader()
+        if mp3_loader is not None:
+            try:
+                audio = mp3_loader(path_str)
+                info = getattr(audio, "info", None)
+                if info is not None:
+                    duration = getattr(info, "length", None)
+                    sample_rate = getattr(info, "sample_rate", None)
+                    if duration is not None:
+                        duration = float(duration)
+                    if sample_rate is not None:
+                        sample_rate = int(sample_rate)
+            except Exception:
+                duration = None
+                sample_rate = None
+    return duration, sample_rate
+
+
+def create_playlist_entry(path: Path) -> PlaylistEntry:
+    try:
+        stat = path.stat()
+    except OSError:
+        return PlaylistEntry(path=path)
+    duration, sample_rate = _probe_audio(str(path), stat.st_size, stat.st_mtime_ns)
+    return PlaylistEntry(path=path, duration=duration, sample_rate=sample_rate)
+
+
+def create_playlist_entries(paths: Sequence[Path]) -> List[PlaylistEntry]:
+    """Read metadata for several files concurrently, preserving order."""
+
+    if len(paths) < 2:
+        return [create_playlist_entry(path) for path in paths]
+    metas = _probe_wav_headers_uring(paths)
+    if metas is None:
+        return list(_get_metadata_pool().map(create_playlist_entry, paths))
+    pending = [path for path, meta in zip(paths, metas) if meta is None]
+    probed = iter(_get_metadata_pool().map(create_playlist_entry, pending))
+    return [
+        PlaylistEntry(path=path, duration=meta[0], sample_rate=meta[1])
+        if meta is not None
+        else next(probed)
+        for path, meta in zip(paths, metas)
+    ]
+
+
+_TX_MODULE = None
+_EXPORT_MODULE = None
+_METADATA_POOL: Optional[ThreadPoolExecutor] = None
+_METADATA_WORKERS = 8
+
+
+def _get_tx_module():
+    """Lazily import the transmitter flowgraph module (pulls in GNU Radio)."""
+
+    global _TX_MODULE
+    if _TX_MODULE is None:
+        _TX_MODULE = importlib.import_module("multich_nbfm_tx")
+    return _TX_MODULE
+
+
+def _get_metadata_pool() -> ThreadPoolExecutor:
+    """Return the shared pool for small file reads kept off the Tk thread."""
+
+    global _METADATA_POOL
+    if _METADATA_POOL is None:
+        _METADATA_POOL = ThreadPoolExecutor(
+            max_workers=_METADATA_WORKERS, thread_name_prefix="playlist-meta"
+        )
+    return _METADATA_POOL
+
+
+_APP_ICONS: "weakref.WeakKeyDictionary[tk.Misc, tk.PhotoImage]" = weakref.WeakKeyDictionary()
+_APP_ICON_MAX_DIM = 64
+
+
+def get_app_icon(widget: tk.Misc) -> tk.PhotoImage:
+    """Return the window icon for ``widget``'s Tk root, building it on first use.
+
+    Tk decodes the embedded PNG and subsamples it once per interpreter; any
+    later window under the same root (dialogs, reopened toplevels) reuses
+    that image.
+    """
+
+    root = widget._root()
+    icon = _APP_ICONS.get(root)
+    if icon is None:
+        icon = tk.PhotoImage(master=root, data=APP_ICON_BASE64)
+        max_dim = max(icon.width(), icon.height())
+        if max_dim > _APP_ICON_MAX_DIM:
+            factor = math.ceil(max_dim / _APP_ICON_MAX_DIM)
+            icon = icon.subsample(factor, factor)
+        _APP_ICONS[root] = icon
+    return icon
+
+
+def _get_export_module():
+    """Lazily import the HackRF export helpers."""
+
+    global _EXPORT_MODULE
+    if _EXPORT_MODULE is None:
+        _EXPORT_MODULE = importlib.import_module("hackrf_export")
+    return _EXPORT_MODULE
+
+
 def load_channel_presets() -> List[ChannelPreset]:
     """Load channel presets from the packaged CSV file."""
 
@@ -296,18 +739,33 @@ def load_presets_from_csv(presets_path: Path) -> List[ChannelPreset]:
         )
 
     presets: List[ChannelPreset] = []
+    intern = sys.intern
     with presets_path.open(newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        # Resolve column positions once instead of building a dict per row.
+        # A missing column maps to -1, which the range checks below reject,
+        # so extra trailing fields are ignored just as DictReader did.
+        columns = {name: idx for idx, name in enumerate(header)}
+        id_idx = columns.get("channel_id", -1)
+        name_idx = columns.get("display_name", -1)
+        freq_idx = columns.get("frequency_hz", -1)
+        ctcss_idx = columns.get("ctcss_hz", -1)
+        dcs_idx = columns.get("dcs_code", -1)
         for row in reader:
+            if not row:
+                continue
+            width = len(row)
+            channel_id = row[id_idx] if 0 <= id_idx < width else None
             try:
-                label = row.get("display_name") or row.get("channel_id")
-                frequency = float(row["frequency_hz"]) if row.get("frequency_hz") else None
-                ctcss_val = (
-                    float(row["ctcss_hz"]) if row.get("ctcss_hz") else None
-                )
-                dcs_val_raw = row.get("dcs_code")
+                label = (row[name_idx] if 0 <= name_idx < width else None) or channel_id
+                frequency_raw = row[freq_idx] if 0 <= freq_idx < width else None
+                frequency = float(frequency_raw) if frequency_raw else None
+                ctcss_raw = row[ctcss_idx] if 0 <= ctcss_idx < width else None
+                ctcss_val = float(ctcss_raw) if ctcss_raw else None
+                dcs_val_raw = row[dcs_idx] if 0 <= dcs_idx < width else None
                 dcs_val = dcs_val_raw.strip() if dcs_val_raw and dcs_val_raw.strip() else None
-            except (KeyError, ValueError) as exc:
+            except ValueError as exc:
                 raise ValueError(
                     f"Invalid row in {presets_path}: {row!r}"  # pragma: no cover - configuration issue
                 ) from exc
@@ -317,14 +775,17 @@ def load_presets_from_csv(presets_path: Path) -> List[ChannelPreset]:
                     f"Incomplete preset definition in {presets_path}: {row!r}"  # pragma: no cover - configuration issue
                 )
 
-            key = row.get("channel_id", label)
+            key = label if channel_id is None else channel_id
+            # Labels and codes recur across presets, reloads and session
+            # files; interning keeps one copy of each string, so equal labels
+            # are also the same object.
             presets.append(
                 ChannelPreset(
-                    key=str(key),
-                    label=str(label),
+                    key=intern(key),
+                    label=intern(label),
                     frequency_hz=frequency,
                     ctcss_hz=ctcss_val,
-                    dcs_code=dcs_val,
+                    dcs_code=intern(dcs_val) if dcs_val else None,
                 )
             )
 
@@ -336,52 +797,57 @@ def load_presets_from_csv(presets_path: Path) -> List[ChannelPreset]:
     return presets
 
 
+_PRESET_FIELDNAMES = ("channel_id", "display_name", "frequency_hz", "ctcss_hz", "dcs_code")
+# Characters that make the csv module quote a field under QUOTE_MINIMAL.
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+
 def presets_to_rows(presets: Sequence[ChannelPreset]) -> List[Dict[str, str]]:
-    rows: List[Dict[str, str]] = []
-    for preset in presets:
-        rows.append(
-            {
-                "channel_id": preset.key,
-                "display_name": preset.label,
-                "frequency_hz": f"{preset.frequency_hz}",
-                "ctcss_hz": "" if preset.ctcss_hz is None else f"{preset.ctcss_hz}",
-                "dcs_code": preset.dcs_code or "",
-            }
-        )
-    return rows
+    return [dict(zip(_PRESET_FIELDNAMES, preset.csv_values)) for preset in presets]
 
 
 def save_presets_to_csv(presets: Sequence[ChannelPreset], path: Path) -> None:
-    rows = presets_to_rows(presets)
-    with path.open("w", newline="", encoding="utf-8") as csvfile:
-        fieldnames = ["channel_id", "display_name", "frequency_hz", "ctcss_hz", "dcs_code"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    lines = itertools.chain(
+        (_PRESET_FIELDNAMES,), (preset.csv_values for preset in presets)
+    )
+    # Rows stream straight into the temp file. Rows that need no quoting are
+    # joined directly, which is byte-for-byte what csv.writer would produce;
+    # the rest go through csv.writer on the same handle.
+    with replace_on_close(path, newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        write = csvfile.write
+        for line in lines:
+            if any(_CSV_SPECIAL_CHARS.intersection(value) for value in line):
+                writer.writerow(line)
+            else:
+                write(",".join(line) + "\r\n")
 
 
 def rows_to_presets(rows: Sequence[Dict[str, str]]) -> List[ChannelPreset]:
     presets: List[ChannelPreset] = []
+    append = presets.append
+    intern = sys.intern
     for row in rows:
+        get = row.get
+        channel_id = get("channel_id")
+        label = get("display_name") or channel_id
+        freq_text = get("frequency_hz")
+        if label is None or freq_text is None:
+            continue
         try:
-            label = row.get("display_name") or row.get("channel_id")
-            freq_text = row.get("frequency_hz")
-            if label is None or freq_text is None:
-                continue
             frequency = float(freq_text)
-            ctcss_text = row.get("ctcss_hz") or ""
+            ctcss_text = get("ctcss_hz")
             ctcss = float(ctcss_text) if ctcss_text else None
-            dcs_code = row.get("dcs_code") or None
         except (ValueError, TypeError):
             continue
-        key = row.get("channel_id") or str(label)
-        presets.append(
+        dcs_code = get("dcs_code")
+        append(
             ChannelPreset(
-                key=str(key),
-                label=str(label),
+                key=intern(str(channel_id or label)),
+                label=intern(str(label)),
                 frequency_hz=frequency,
                 ctcss_hz=ctcss,
-                dcs_code=dcs_code,
+                dcs_code=intern(str(dcs_code)) if dcs_code else None,
             )
         )
     return presets
@@ -392,35 +858,80 @@ class ChannelRow(ttk.Frame):
 
     _last_directory: Optional[Path] = None
 
-    def __init__(self, master, presets: List[ChannelPreset], controller):
+    # Status line for every (ctcss_mode, dcs_mode) pair; any mode other than
+    # "off"/"preset" is shown as custom.
+    _TONE_STATUS: Mapping[Tuple[str, str], str] = types.MappingProxyType(
+        {
+            (ctcss, dcs): f"CTCSS {ctcss} · DCS {dcs}"
+            for ctcss, dcs in itertools.product(("off", "preset", "custom"), repeat=2)
+        }
+    )
+
+    def __init__(self, master, presets: PresetIndex, controller, *, lazy: bool = False):
         super().__init__(master, style="ChannelRow.TFrame", padding=8)
         self.controller = controller
         self.preset_var = tk.StringVar()
         self.gain_var = tk.StringVar(value="1.0")
         self.playlist: List[PlaylistEntry] = []
-        self._labels = [preset.label for preset in presets]
-        self._preset_map: Dict[str, ChannelPreset] = {
-            preset.label: preset for preset in presets
-        }
+        # Treeview item ids aligned index-for-index with self.playlist.
+        self._tree_item_ids: List[str] = []
+        self._total_duration = 0.0
+        self._presets = presets
         self._base_style = "ChannelRow.TFrame"
         self._error_style = "ChannelRowError.TFrame"
+        # Mirrors of the applied style and error text so repeat calls skip Tcl.
+        self._current_style = self._base_style
+        self._error_message = ""
+        # The Tk variables are the row's state; the widgets that edit them
+        # are only built once the row is first shown (see ensure_materialized).
+        self._materialized = False
 
         self.header = ttk.Label(self, text="Channel")
         self.header.grid(row=0, column=0, padx=4, pady=2, sticky="w")
 
+        self.ctcss_mode = tk.StringVar(value="off")
+        self.ctcss_custom_var = tk.StringVar()
+        self.dcs_mode = tk.StringVar(value="off")
+        self.dcs_custom_var = tk.StringVar()
+        self._ctcss_user_override = False
+        self._dcs_user_override = False
+        self._ctcss_value: Optional[float] = None
+        self._dcs_value: Optional[str] = None
+        self._tone_refresh_id: Optional[str] = None
+        self.playlist_summary_var = tk.StringVar(value="No files queued")
+        self.error_var = tk.StringVar(value="")
+        if self._presets.labels:
+            self.preset_var.set(self._presets.labels[0])
+        self._update_tone_controls()
+
+        if not lazy:
+            self.ensure_materialized()
+
+    def ensure_materialized(self) -> None:
+        """Build the editing widgets if they have not been created yet."""
+
+        if self._materialized:
+            return
+        self._build_body()
+        self._materialized = True
+        self._append_tree_items(self.playlist)
+        self._sync_preset_radios()
+        # Only sync the widgets: clearing here would wipe an error raised
+        # while the row was still collapsed.
+        self._sync_tone_widgets()
+
+    def _build_body(self) -> None:
         ttk.Label(self, text="FRS/GMRS Channel:").grid(
             row=1, column=0, padx=4, pady=2, sticky="w"
         )
         self.channel_combo = ttk.Combobox(
             self,
             textvariable=self.preset_var,
-            values=self._labels,
+            values=self._presets.labels,
             state="readonly",
             width=35,
         )
         self.channel_combo.grid(row=1, column=1, padx=4, pady=2, sticky="we")
-        if self._labels:
-            self.preset_var.set(self._labels[0])
 
         ttk.Label(self, text="Gain (linear):").grid(
             row=2, column=0, padx=4, pady=2, sticky="w"
@@ -428,15 +939,6 @@ class ChannelRow(ttk.Frame):
         self.gain_entry = ttk.Entry(self, textvariable=self.gain_var, width=10)
         self.gain_entry.grid(row=2, column=1, padx=4, pady=2, sticky="we")
 
-        self.ctcss_mode = tk.StringVar(value="off")
-        self.ctcss_custom_var = tk.StringVar()
-        self.dcs_mode = tk.StringVar(value="off")
-        self.dcs_custom_var = tk.StringVar()
-        self._ctcss_user_override = False
-        self._dcs_user_override = False
-        self._ctcss_value: Optional[float] = None
-        self._dcs_value: Optional[str] = None
-
         ttk.Label(self, text="CTCSS Tone:").grid(
             row=3, column=0, padx=4, pady=2, sticky="nw"
         )
@@ -533,7 +1035,6 @@ class ChannelRow(ttk.Frame):
         self.file_listbox.configure(yscrollcommand=scrollbar.set)
         playlist_frame.columnconfigure(0, weight=1)
 
-        self.playlist_summary_var = tk.StringVar(value="No files queued")
         summary_label = ttk.Label(self, textvariable=self.playlist_summary_var, font=("", 9))
         summary_label.grid(row=8, column=0, columnspan=2, padx=4, pady=(0, 4), sticky="w")
 
@@ -569,12 +1070,10 @@ class ChannelRow(ttk.Frame):
         )
         ttk.Button(channel_controls, text="Remove", command=self.remove).grid(row=0, column=3, padx=2)
 
-        self.error_var = tk.StringVar(value="")
         self.error_label = ttk.Label(self, textvariable=self.error_var, foreground="#a40000")
         self.error_label.grid(row=10, column=0, columnspan=2, padx=4, pady=2, sticky="w")
 
         self.channel_combo.bind("<<ComboboxSelected>>", self._on_preset_changed)
-        self._update_tone_controls()
 
         self.columnconfigure(1, weight=1)
         self.rowconfigure(7, weight=1)
@@ -587,10 +1086,10 @@ class ChannelRow(ttk.Frame):
         label = self.preset_var.get().strip()
         if not label:
             raise ValueError("Each channel requires a preset selection")
-        preset = self._preset_map.get(label)
-        if preset is None:
+        idx = self._presets.positions.get(label)
+        if idx is None:
             raise ValueError(f"Unknown preset selected: {label}")
-        return preset.frequency_hz
+        return self._presets.frequencies[idx]
 
     def get_ctcss_tone(self) -> Optional[float]:
         mode = self.ctcss_mode.get()
@@ -641,11 +1140,9 @@ class ChannelRow(ttk.Frame):
             dialog_kwargs["initialdir"] = str(self._last_directory)
         filenames = filedialog.askopenfilenames(**dialog_kwargs)
         if filenames:
-            for name in filenames:
-                path = Path(name).expanduser()
-                self.playlist.append(self._create_entry(path))
-                self.__class__._last_directory = path.parent
-            self._refresh_playlist()
+            paths = [Path(name).expanduser() for name in filenames]
+            self._append_entries(create_playlist_entries(paths))
+            self.__class__._last_directory = paths[-1].parent
 
     def clear_playlist(self) -> None:
         """Remove every queued file with a single action."""
@@ -662,10 +1159,16 @@ class ChannelRow(ttk.Frame):
         if not selections:
             return
         indices = sorted([self.file_listbox.index(item) for item in selections], reverse=True)
+        removed: List[str] = []
         for idx in indices:
             if 0 <= idx < len(self.playlist):
-                self.playlist.pop(idx)
-        self._refresh_playlist()
+                entry = self.playlist.pop(idx)
+                removed.append(self._tree_item_ids.pop(idx))
+                if entry.duration is not None:
+                    self._total_duration -= entry.duration
+        if removed:
+            self.file_listbox.delete(*removed)
+        self._update_playlist_summary()
 
     def move_selected(self, direction: int) -> None:
         if direction not in (-1, 1):
@@ -682,33 +1185,51 @@ class ChannelRow(ttk.Frame):
             self.playlist[new_index],
             self.playlist[index],
         )
-        self._refresh_playlist()
-        item_id = self.file_listbox.get_children()[new_index]
+        ids = self._tree_item_ids
+        ids[index], ids[new_index] = ids[new_index], ids[index]
+        item_id = ids[new_index]
+        self.file_listbox.move(item_id, "", new_index)
         self.file_listbox.selection_set(item_id)
 
     def _refresh_playlist(self) -> None:
-        for item in self.file_listbox.get_children():
-            self.file_listbox.delete(item)
-        total_duration = 0.0
-        for entry in self.playlist:
-            duration_text = "–"
-            rate_text = "–"
+        """Rebuild the tree from scratch; edits use the incremental helpers."""
+
+        if self._tree_item_ids:
+            self.file_listbox.delete(*self._tree_item_ids)
+        self._tree_item_ids = []
+        self._total_duration = 0.0
+        entries, self.playlist = self.playlist, []
+        self._append_entries(entries)
+
+    def _append_entries(self, entries: Sequence[PlaylistEntry]) -> None:
+        for entry in entries:
             if entry.duration is not None:
-                total_duration += entry.duration
-                duration_text = f"{entry.duration:.2f}"
-            if entry.sample_rate is not None:
-                rate_text = f"{entry.sample_rate:,d} Hz"
-            self.file_listbox.insert(
+                self._total_duration += entry.duration
+        self.playlist.extend(entries)
+        if self._materialized:
+            self._append_tree_items(entries)
+        self._update_playlist_summary()
+
+    def _append_tree_items(self, entries: Sequence[PlaylistEntry]) -> None:
+        for entry in entries:
+            duration_text = "–" if entry.duration is None else f"{entry.duration:.2f}"
+            rate_text = "–" if entry.sample_rate is None else f"{entry.sample_rate:,d} Hz"
+            item_id = self.file_listbox.insert(
                 "",
                 tk.END,
                 text=entry.path.name,
                 values=(duration_text, rate_text),
             )
+            self._tree_item_ids.append(item_id)
+
+    def _update_playlist_summary(self) -> None:
         if self.playlist:
             self.playlist_summary_var.set(
-                f"{len(self.playlist)} file(s) • Total duration: {total_duration:.2f}s"
+                f"{len(self.playlist)} file(s) • "
+                f"Total duration: {self._total_duration:.2f}s"
             )
         else:
+            self._total_duration = 0.0
             self.playlist_summary_var.set("No files queued")
 
     def remove(self) -> None:
@@ -728,67 +1249,29 @@ class ChannelRow(ttk.Frame):
         self.dcs_custom_var.set("")
         self._update_tone_controls()
 
-    def _create_entry(self, path: Path) -> PlaylistEntry:
-        duration: Optional[float] = None
-        sample_rate: Optional[int] = None
-        if path.suffix.lower() == ".wav":
-            try:
-                with contextlib.closing(wave.open(str(path), "rb")) as wav_file:
-                    frames = wav_file.getnframes()
-                    rate = wav_file.getframerate()
-                    sample_rate = rate
-                    duration = frames / rate if rate else None
-            except Exception:
-                duration = None
-                sample_rate = None
-        elif path.suffix.lower() == ".mp3":
-            mp3_loader = _get_mp3_loader()
-            if mp3_loader is not None:
-                try:
-                    audio = mp3_loader(str(path))
-                    info = getattr(audio, "info", None)
-                    if info is not None:
-                        duration = getattr(info, "length", None)
-                        sample_rate = getattr(info, "sample_rate", None)
-                        if duration is not None:
-                            duration = float(duration)
-                        if sample_rate is not None:
-                            sample_rate = int(sample_rate)
-                except Exception:
-                    duration = None
-                    sample_rate = None
-        return PlaylistEntry(path=path, duration=duration, sample_rate=sample_rate)
-
     def get_playlist_paths(self) -> List[Path]:
         return [entry.path for entry in self.playlist]
 
     def _update_tone_controls(self) -> None:
         label = self.preset_var.get().strip()
-        preset = self._preset_map.get(label)
-        self._ctcss_value = preset.ctcss_hz if preset else None
-        self._dcs_value = preset.dcs_code if preset else None
+        idx = self._presets.positions.get(label)
+        self._ctcss_value = self._presets.ctcss[idx] if idx is not None else None
+        self._dcs_value = self._presets.dcs[idx] if idx is not None else None
+        self._sync_preset_radios()
 
         ctcss_available = self._ctcss_value is not None
         if ctcss_available:
-            self.ctcss_preset_radio.state(["!disabled"])
-            self.ctcss_preset_radio.config(
-                text=f"Preset ({self._ctcss_value:.1f} Hz)"
-            )
             if not self._ctcss_user_override:
                 self.ctcss_mode.set("preset")
         else:
-            self.ctcss_preset_radio.state(["disabled"])
             if not self._ctcss_user_override or self.ctcss_mode.get() == "preset":
                 self.ctcss_mode.set("off")
 
         dcs_available = self._dcs_value is not None
         if dcs_available:
-            self.dcs_preset_radio.state(["!disabled"])
-            self.dcs_preset_radio.config(text=f"Preset ({self._dcs_value})")
             if not self._dcs_user_override and self.ctcss_mode.get() == "off":
                 self.dcs_mode.set("preset")
         else:
-            self.dcs_preset_radio.state(["disabled"])
             if not self._dcs_user_override or self.dcs_mode.get() == "preset":
                 self.dcs_mode.set("off")
 
@@ -800,72 +1283,114 @@ class ChannelRow(ttk.Frame):
             else:
                 self.ctcss_mode.set("off")
 
+    def _sync_preset_radios(self) -> None:
+        if not self._materialized:
+            return
+        if self._ctcss_value is not None:
+            self.ctcss_preset_radio.state(["!disabled"])
+            self.ctcss_preset_radio.config(text=f"Preset ({self._ctcss_value:.1f} Hz)")
+        else:
+            self.ctcss_preset_radio.state(["disabled"])
+        if self._dcs_value is not None:
+            self.dcs_preset_radio.state(["!disabled"])
+            self.dcs_preset_radio.config(text=f"Preset ({self._dcs_value})")
+        else:
+            self.dcs_preset_radio.state(["disabled"])
+
     def _on_ctcss_mode_change(self) -> None:
         self._ctcss_user_override = True
         if self.ctcss_mode.get() != "off" and self.dcs_mode.get() != "off":
             self.dcs_mode.set("off")
-        self._refresh_tone_status()
+        self._schedule_tone_refresh()
 
     def _on_dcs_mode_change(self) -> None:
         self._dcs_user_override = True
         if self.dcs_mode.get() != "off" and self.ctcss_mode.get() != "off":
             self.ctcss_mode.set("off")
+        self._schedule_tone_refresh()
+
+    def _schedule_tone_refresh(self) -> None:
+        # Coalesce bursts of mode changes into one widget update per idle
+        # cycle, the same way the main window batches log lines.
+        if self._tone_refresh_id is None:
+            self._tone_refresh_id = self.after_idle(self._flush_tone_refresh)
+
+    def _flush_tone_refresh(self) -> None:
+        self._tone_refresh_id = None
         self._refresh_tone_status()
 
+    def destroy(self) -> None:
+        if self._tone_refresh_id is not None:
+            self.after_cancel(self._tone_refresh_id)
+            self._tone_refresh_id = None
+        super().destroy()
+
     def _refresh_tone_status(self) -> None:
         self.clear_error()
-        if self.ctcss_mode.get() == "custom":
-            self.ctcss_entry.state(["!disabled"])
-        else:
-            self.ctcss_entry.state(["disabled"])
-
-        if self.dcs_mode.get() == "custom":
-            self.dcs_entry.state(["!disabled"])
-        else:
-            self.dcs_entry.state(["disabled"])
-
-        status_bits = []
-        if self.ctcss_mode.get() == "off":
-            status_bits.append("CTCSS off")
-        elif self.ctcss_mode.get() == "preset":
-            status_bits.append("CTCSS preset")
-        else:
-            status_bits.append("CTCSS custom")
+        if self._materialized:
+            self._sync_tone_widgets()
 
-        if self.dcs_mode.get() == "off":
-            status_bits.append("DCS off")
-        elif self.dcs_mode.get() == "preset":
-            status_bits.append("DCS preset")
-        else:
-            status_bits.append("DCS custom")
+    def _sync_tone_widgets(self) -> None:
+        ctcss_mode = self.ctcss_mode.get()
+        dcs_mode = self.dcs_mode.get()
+        self.ctcss_entry.state(["!disabled" if ctcss_mode == "custom" else "disabled"])
+        self.dcs_entry.state(["!disabled" if dcs_mode == "custom" else "disabled"])
 
-        self.tone_status.config(text=" · ".join(status_bits))
+        if ctcss_mode not in ("off", "preset"):
+            ctcss_mode = "custom"
+        if dcs_mode not in ("off", "preset"):
+            dcs_mode = "custom"
+        self.tone_status.config(text=self._TONE_STATUS[ctcss_mode, dcs_mode])
 
     def clear_error(self) -> None:
-        self.error_var.set("")
-        self.configure(style=self._base_style)
+        self._set_error_state("", self._base_style)
 
     def show_error(self, message: str) -> None:
-        self.error_var.set(message)
-        self.configure(style=self._error_style)
+        self._set_error_state(message, self._error_style)
+
+    def _set_error_state(self, message: str, style: str) -> None:
+        if message != self._error_message:
+            self._error_message = message
+            self.error_var.set(message)
+        if style != self._current_style:
+            self._current_style = style
+            self.configure(style=style)
 
-    def update_presets(self, presets: List[ChannelPreset]) -> None:
+    def update_presets(self, presets: PresetIndex) -> None:
         """Refresh the available preset list while preserving the selection when possible."""
 
+        if presets is self._presets:
+            return
         current_label = self.preset_var.get()
-        self._labels = [preset.label for preset in presets]
-        self._preset_map = {preset.label: preset for preset in presets}
-        self.channel_combo.configure(values=self._labels)
-        if current_label in self._preset_map:
+        previous = self._presets
+        self._presets = presets
+        if presets.labels == previous.labels:
+            idx = presets.positions.get(current_label)
+            if (
+                idx is not None
+                and presets.ctcss[idx] == previous.ctcss[idx]
+                and presets.dcs[idx] == previous.dcs[idx]
+            ):
+                # This row's selection and tones are untouched; frequencies are
+                # read from self._presets on demand, so nothing else to do.
+                return
+        elif self._materialized:
+            self.channel_combo.configure(values=presets.labels)
+        if current_label in self._presets.positions:
             self.preset_var.set(current_label)
-        elif self._labels:
-            self.preset_var.set(self._labels[0])
+        elif self._presets.labels:
+            self.preset_var.set(self._presets.labels[0])
         else:
             self.preset_var.set("")
         self._update_tone_controls()
 
     def set_playlist(self, paths: Sequence[Path]) -> None:
-        self.playlist = [self._create_entry(path) for path in paths]
+        self.set_playlist_entries(create_playlist_entries(paths))
+
+    def set_playlist_entries(self, entries: Sequence[PlaylistEntry]) -> None:
+        """Replace the playlist with entries whose metadata is already known."""
+
+        self.playlist = list(entries)
         self._refresh_playlist()
 
     def serialize_state(self) -> Dict[str, object]:
@@ -879,31 +1404,58 @@ class ChannelRow(ttk.Frame):
             "playlist": [str(entry.path) for entry in self.playlist],
         }
 
-    def apply_state(self, data: Dict[str, object]) -> None:
+    def apply_state(
+        self,
+        data: Dict[str, object],
+        entries: Optional[Sequence[PlaylistEntry]] = None,
+    ) -> None:
+        """Restore a serialized row; ``entries`` skips re-probing the playlist."""
+
         preset_label = data.get("preset_label")
-        if preset_label and preset_label in self._preset_map:
+        if preset_label and preset_label in self._presets.positions:
             self.preset_var.set(preset_label)
-        elif self._labels:
-            self.preset_var.set(self._labels[0])
+        elif self._presets.labels:
+            self.preset_var.set(self._presets.labels[0])
         self.gain_var.set(data.get("gain", "1.0"))
         self.ctcss_mode.set(data.get("ctcss_mode", "off"))
         self.ctcss_custom_var.set(data.get("ctcss_custom", ""))
         self.dcs_mode.set(data.get("dcs_mode", "off"))
         self.dcs_custom_var.set(data.get("dcs_custom", ""))
-        playlist_paths = [Path(p) for p in data.get("playlist", [])]
-        self.set_playlist(playlist_paths)
-        self._refresh_tone_status()
+        if entries is not None:
+            self.set_playlist_entries(entries)
+        else:
+            self.set_playlist([Path(p) for p in data.get("playlist", [])])
+        self._schedule_tone_refresh()
+
+
+# \w matches exactly what str.isalnum() accepts, plus the underscore.
+_KEY_UNSAFE_RE = re.compile(r"[^\w-]")
+
+
+@functools.lru_cache(maxsize=256)
+def _suggested_preset_key(label: str) -> str:
+    """Derive a channel ID from a display name, keeping word chars and '-'."""
+
+    return _KEY_UNSAFE_RE.sub("", label) or label.replace(" ", "_")
 
 
 class PresetEditorDialog(simpledialog.Dialog):
     """Modal dialog that edits/creates a preset entry."""
 
-    def __init__(self, master, *, existing_keys: Sequence[str], preset: Optional[ChannelPreset] = None):
-        self._existing_keys = {key for key in existing_keys}
+    # Quiet period after the last variable write before handlers run.
+    _TRACE_DEBOUNCE_MS = 60
+
+    def __init__(self, master, *, existing_keys: Iterable[str], preset: Optional[ChannelPreset] = None):
+        self._existing_keys = set(existing_keys)
         self._preset = preset
         if preset is not None:
             self._existing_keys.discard(preset.key)
         self.result: Optional[ChannelPreset] = None
+        # Variable writes are funnelled through one trace callback and drained
+        # on a trailing-edge timer; handlers run in registration order.
+        self._trace_handlers: Dict[str, Callable[[], None]] = {}
+        self._dirty_traces: Set[str] = set()
+        self._trace_flush_id: Optional[str] = None
         super().__init__(master, title="Edit Preset" if preset else "Add Preset")
 
     def body(self, master):
@@ -934,10 +1486,40 @@ class PresetEditorDialog(simpledialog.Dialog):
         self.dcs_entry = ttk.Entry(master, textvariable=self.dcs_var, width=30)
         self.dcs_entry.grid(row=4, column=1, padx=4, pady=4)
 
-        self.label_var.trace_add("write", self._suggest_key)
+        if self._preset is None:
+            self._watch_var(self.label_var, self._suggest_key)
         return self.label_entry
 
+    def _watch_var(self, var: tk.Variable, handler: Callable[[], None]) -> None:
+        self._trace_handlers[str(var)] = handler
+        var.trace_add("write", self._on_var_write)
+
+    def _on_var_write(self, name: str, _index: str, _mode: str) -> None:
+        self._dirty_traces.add(name)
+        if self._trace_flush_id is not None:
+            self.after_cancel(self._trace_flush_id)
+        self._trace_flush_id = self.after(self._TRACE_DEBOUNCE_MS, self._drain_traces)
+
+    def _drain_traces(self) -> None:
+        self._trace_flush_id = None
+        dirty, self._dirty_traces = self._dirty_traces, set()
+        for name, handler in self._trace_handlers.items():
+            if name in dirty:
+                handler()
+
+    def destroy(self) -> None:
+        if self._trace_flush_id is not None:
+            self.after_cancel(self._trace_flush_id)
+            self._trace_flush_id = None
+        super().destroy()
+
     def validate(self) -> bool:  # pragma: no cover - modal UI
+        # Apply edits still waiting on the debounce so OK sees the same
+        # derived fields the user would have seen a moment later.
+        if self._trace_flush_id is not None:
+            self.after_cancel(self._trace_flush_id)
+            self._trace_flush_id = None
+        self._drain_traces()
         label = self.label_var.get().strip()
         key = self.key_var.get().strip() or label
         if not label:
@@ -977,7 +1559,7 @@ class PresetEditorDialog(simpledialog.Dialog):
     def apply(self):  # pragma: no cover - modal UI
         pass
 
-    def _suggest_key(self, *_):
+    def _suggest_key(self) -> None:
         if self._preset:
             return
         if self.key_var.get().strip():
@@ -985,14 +1567,20 @@ class PresetEditorDialog(simpledialog.Dialog):
         label = self.label_var.get().strip()
         if not label:
             return
-        sanitized = "".join(ch for ch in label if ch.isalnum() or ch in ("_", "-"))
-        sanitized = sanitized or label.replace(" ", "_")
-        self.key_var.set(sanitized)
+        self.key_var.set(_suggested_preset_key(label))
 
 
 class PresetManagerDialog(tk.Toplevel):
     """Dialog that lets the operator manage preset CSV entries."""
 
+    # (column id, heading, width, anchor)
+    _TREE_COLUMNS = (
+        ("label", "Display Name", 220, "w"),
+        ("frequency", "Frequency (Hz)", 120, "center"),
+        ("ctcss", "CTCSS", 100, "center"),
+        ("dcs", "DCS", 80, "center"),
+    )
+
     def __init__(self, master, presets: Sequence[ChannelPreset]):
         super().__init__(master)
         self.title("Preset Manager")
@@ -1000,27 +1588,28 @@ class PresetManagerDialog(tk.Toplevel):
         self.resizable(True, True)
         self.presets: List[ChannelPreset] = list(presets)
         self.result: Optional[List[ChannelPreset]] = None
+        # Treeview item ids aligned index-for-index with self.presets.
+        self._tree_iids: List[str] = []
+        # Usage count per key; imported CSVs may repeat a key, and it stays
+        # reserved until its last preset is gone.
+        self._key_counts: collections.Counter[str] = collections.Counter(
+            preset.key for preset in self.presets
+        )
 
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
 
         ttk.Label(self, text="Available presets").grid(row=0, column=0, padx=10, pady=(10, 0), sticky="w")
-        columns = ("label", "frequency", "ctcss", "dcs")
         self.tree = ttk.Treeview(
             self,
-            columns=columns,
+            columns=tuple(column for column, *_ in self._TREE_COLUMNS),
             show="headings",
             selectmode="browse",
             height=12,
         )
-        self.tree.heading("label", text="Display Name")
-        self.tree.heading("frequency", text="Frequency (Hz)")
-        self.tree.heading("ctcss", text="CTCSS")
-        self.tree.heading("dcs", text="DCS")
-        self.tree.column("label", width=220)
-        self.tree.column("frequency", width=120, anchor="center")
-        self.tree.column("ctcss", width=100, anchor="center")
-        self.tree.column("dcs", width=80, anchor="center")
+        for column, heading, width, anchor in self._TREE_COLUMNS:
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor=anchor)
         self.tree.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
 
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
@@ -1050,16 +1639,25 @@ class PresetManagerDialog(tk.Toplevel):
         self.grab_set()
 
     def _refresh_tree(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for preset in self.presets:
-            ctcss = "–" if preset.ctcss_hz is None else f"{preset.ctcss_hz:g}"
-            dcs = preset.dcs_code or "–"
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(preset.label, f"{preset.frequency_hz:g}", ctcss, dcs),
-            )
+        """Rebuild the tree from scratch; single edits update one row only."""
+
+        if self._tree_iids:
+            self.tree.delete(*self._tree_iids)
+        self._tree_iids = [
+            self.tree.insert("", tk.END, values=self._tree_values(preset))
+            for preset in self.presets
+        ]
+
+    @staticmethod
+    def _tree_values(preset: ChannelPreset) -> Tuple[str, str, str, str]:
+        ctcss = "–" if preset.ctcss_hz is None else f"{preset.ctcss_hz:g}"
+        dcs = preset.dcs_code or "–"
+        return preset.label, f"{preset.frequency_hz:g}", ctcss, dcs
+
+    def _release_key(self, key: str) -> None:
+        self._key_counts[key] -= 1
+        if self._key_counts[key] <= 0:
+            del self._key_counts[key]
 
     def _selected_index(self) -> Optional[int]:
         selection = self.tree.selection()
@@ -1068,10 +1666,13 @@ class PresetManagerDialog(tk.Toplevel):
         return self.tree.index(selection[0])
 
     def add_preset(self):  # pragma: no cover - modal UI
-        dialog = PresetEditorDialog(self, existing_keys=[preset.key for preset in self.presets])
+        dialog = PresetEditorDialog(self, existing_keys=self._key_counts)
         if dialog.result is not None:
             self.presets.append(dialog.result)
-            self._refresh_tree()
+            self._key_counts[dialog.result.key] += 1
+            self._tree_iids.append(
+                self.tree.insert("", tk.END, values=self._tree_values(dialog.result))
+            )
             self.status_var.set(f"Added preset '{dialog.result.label}'.")
 
     def edit_selected(self):  # pragma: no cover - modal UI
@@ -1080,12 +1681,15 @@ class PresetManagerDialog(tk.Toplevel):
             return
         dialog = PresetEditorDialog(
             self,
-            existing_keys=[preset.key for preset in self.presets],
+            existing_keys=self._key_counts,
             preset=self.presets[idx],
         )
         if dialog.result is not None:
+            old_key = self.presets[idx].key
             self.presets[idx] = dialog.result
-            self._refresh_tree()
+            self._release_key(old_key)
+            self._key_counts[dialog.result.key] += 1
+            self.tree.item(self._tree_iids[idx], values=self._tree_values(dialog.result))
             self.status_var.set(f"Updated preset '{dialog.result.label}'.")
 
     def delete_selected(self):  # pragma: no cover - modal UI
@@ -1093,7 +1697,8 @@ class PresetManagerDialog(tk.Toplevel):
         if idx is None:
             return
         preset = self.presets.pop(idx)
-        self._refresh_tree()
+        self._release_key(preset.key)
+        self.tree.delete(self._tree_iids.pop(idx))
         self.status_var.set(f"Deleted preset '{preset.label}'.")
 
     def import_presets(self):  # pragma: no cover - modal UI
@@ -1104,14 +1709,16 @@ class PresetManagerDialog(tk.Toplevel):
         )
         if not filename:
             return
+        path = Path(filename)
         try:
-            imported = load_presets_from_csv(Path(filename))
+            imported = load_presets_from_csv(path)
         except Exception as exc:
             messagebox.showerror("Import failed", str(exc), parent=self)
             return
         self.presets = list(imported)
+        self._key_counts = collections.Counter(preset.key for preset in self.presets)
         self._refresh_tree()
-        self.status_var.set(f"Loaded {len(imported)} presets from {Path(filename).name}.")
+        self.status_var.set(f"Loaded {len(imported)} presets from {path.name}.")
 
     def export_presets(self):  # pragma: no cover - modal UI
         if not self.presets:
@@ -1125,12 +1732,13 @@ class PresetManagerDialog(tk.Toplevel):
         )
         if not filename:
             return
+        path = Path(filename)
         try:
-            save_presets_to_csv(self.presets, Path(filename))
+            save_presets_to_csv(self.presets, path)
         except Exception as exc:
             messagebox.showerror("Export failed", str(exc), parent=self)
             return
-        self.status_var.set(f"Exported {len(self.presets)} presets to {Path(filename).name}.")
+        self.status_var.set(f"Exported {len(self.presets)} presets to {path.name}.")
 
     def save_changes(self):  # pragma: no cover - modal UI
         self.result = list(self.presets)
@@ -1143,7 +1751,8 @@ class TransmitterSettingsDialog(simpledialog.Dialog):
     def __init__(self, master, settings: Dict[str, Optional[float]]):
         self._settings = dict(settings)
         self.result: Optional[Dict[str, Optional[float]]] = None
-        self._vars: Dict[str, tk.StringVar] = {}
+        # Entry widgets aligned index-for-index with _TX_FIELDS_FLAT.
+        self._entries: List[ttk.Entry] = []
         super().__init__(master, title="Transmitter Settings")
 
     def body(self, master):  # pragma: no cover - modal UI
@@ -1154,12 +1763,12 @@ class TransmitterSettingsDialog(simpledialog.Dialog):
                 row=row, column=0, sticky="w", padx=6, pady=(8 if idx == 0 else 4, 0)
             )
             key = field["key"]
-            var = tk.StringVar(value=_format_setting_value(self._settings.get(key)))
-            entry = ttk.Entry(master, textvariable=var)
+            entry = ttk.Entry(master)
+            entry.insert(0, _format_setting_value(self._settings.get(key)))
             entry.grid(row=row, column=1, sticky="we", padx=6, pady=(8 if idx == 0 else 4, 0))
             if first_entry is None:
                 first_entry = entry
-            self._vars[key] = var
+            self._entries.append(entry)
             help_text = field.get("help")
             if help_text:
                 ttk.Label(master, text=help_text, font=("", 9, "italic"), wraplength=360).grid(
@@ -1196,18 +1805,19 @@ class TransmitterSettingsDialog(simpledialog.Dialog):
 
     def _collect_settings(self) -> Dict[str, Optional[float]]:
         collected: Dict[str, Optional[float]] = {}
-        for field in TRANSMITTER_SETTING_FIELDS:
-            key = field["key"]
-            text = self._vars[key].get().strip()
+        for (key, name, allow_empty), entry in zip(_TX_FIELDS_FLAT, self._entries):
+            text = entry.get().strip()
             if not text:
-                if field.get("allow_empty"):
+                if allow_empty:
                     collected[key] = None
                     continue
-                raise ValueError(f"{field['name']} is required.")
+                raise ValueError(f"{name} is required.")
             try:
                 value = float(text)
             except ValueError as exc:
-                raise ValueError(f"{field['name']} must be numeric.") from exc
+                raise ValueError(f"{name} must be numeric.") from exc
+            if not math.isfinite(value):
+                raise ValueError(f"{name} must be a finite number.")
             collected[key] = value
         open_val = collected["gate_open_threshold"]
         close_val = collected["gate_close_threshold"]
@@ -1216,10 +1826,10 @@ class TransmitterSettingsDialog(simpledialog.Dialog):
         return collected
 
     def _restore_defaults(self) -> None:
-        for field in TRANSMITTER_SETTING_FIELDS:
-            key = field["key"]
+        for (key, _name, _allow_empty), entry in zip(_TX_FIELDS_FLAT, self._entries):
             default_value = DEFAULT_TRANSMITTER_SETTINGS.get(key)
-            self._vars[key].set(_format_setting_value(default_value))
+            entry.delete(0, tk.END)
+            entry.insert(0, _format_setting_value(default_value))
 
 
     def _on_cancel(self):  # pragma: no cover - modal UI
@@ -1241,6 +1851,9 @@ class CollapsibleSection(ttk.Frame):
         super().__init__(master)
         self._title = title
         self._collapsed = bool(collapsed)
+        self._layout_id: Optional[str] = None
+        # Called whenever the section is expanded, before it is laid out.
+        self.on_expand: Optional[Callable[[], None]] = None
 
         self.columnconfigure(0, weight=1)
 
@@ -1272,25 +1885,44 @@ class CollapsibleSection(ttk.Frame):
         self._title_label.config(text=title)
         self._refresh_toggle_text()
 
+    @property
+    def collapsed(self) -> bool:
+        return self._collapsed
+
     def toggle(self) -> None:
-        self._collapsed = not self._collapsed
-        if self._collapsed:
-            self.content_frame.grid_remove()
-        else:
-            self.content_frame.grid(row=1, column=0, sticky="we")
-        self._refresh_toggle_text()
+        self.set_collapsed(not self._collapsed)
 
     def set_collapsed(self, collapsed: bool) -> None:
-        """Force the collapse state without the user clicking."""
+        """Force the collapse state without the user clicking.
+
+        Only the desired state is recorded here; the content frame is shown
+        or hidden on the next idle cycle so a burst of changes (expand all,
+        session load) costs a single geometry pass.
+        """
 
+        collapsed = bool(collapsed)
         if self._collapsed == collapsed:
             return
         self._collapsed = collapsed
-        if self._collapsed:
+        if not collapsed and self.on_expand is not None:
+            self.on_expand()
+        self._refresh_toggle_text()
+        if self._layout_id is None:
+            self._layout_id = self.after_idle(self._flush_layout)
+
+    def _flush_layout(self) -> None:
+        self._layout_id = None
+        shown = self.content_frame.winfo_manager() == "grid"
+        if self._collapsed and shown:
             self.content_frame.grid_remove()
-        else:
+        elif not self._collapsed and not shown:
             self.content_frame.grid(row=1, column=0, sticky="we")
-        self._refresh_toggle_text()
+
+    def destroy(self) -> None:
+        if self._layout_id is not None:
+            self.after_cancel(self._layout_id)
+            self._layout_id = None
+        super().destroy()
 
     def _refresh_toggle_text(self) -> None:
         symbol = "►" if self._collapsed else "▼"
@@ -1321,20 +1953,31 @@ class MultiChannelApp(tk.Tk):
         *,
         settings_path: Optional[Path] = None,
     ):
+        # Read the preset CSV and settings JSON on worker threads while Tk
+        # spins up its interpreter and connects to the display.
+        settings_path = settings_path or TRANSMITTER_SETTINGS_PATH
+        pool = _get_metadata_pool()
+        presets_future = pool.submit(load_channel_presets)
+        settings_future = pool.submit(load_transmitter_settings, settings_path)
+
         super().__init__()
+        # Keep the root unmapped while it is populated so the window manager
+        # sees one finished layout instead of every intermediate geometry.
+        self.withdraw()
 
         self.title("Multi-channel NBFM TX")
         self.resizable(True, True)
 
         try:
-            self.presets = load_channel_presets()
+            self.presets = presets_future.result()
         except Exception as exc:  # pragma: no cover - UI feedback
             messagebox.showerror("Preset load failure", str(exc))
             raise
+        self._preset_index = PresetIndex.from_presets(self.presets)
 
-        self._settings_path = settings_path or TRANSMITTER_SETTINGS_PATH
+        self._settings_path = settings_path
         try:
-            self._persisted_settings = load_transmitter_settings(self._settings_path)
+            self._persisted_settings = settings_future.result()
         except Exception as exc:  # pragma: no cover - UI feedback
             messagebox.showerror("Transmitter defaults", str(exc))
             raise
@@ -1355,12 +1998,7 @@ class MultiChannelApp(tk.Tk):
 
         self._icon_image: Optional[tk.PhotoImage] = None
         try:
-            icon_source = tk.PhotoImage(data=APP_ICON_BASE64)
-            max_dim = max(icon_source.width(), icon_source.height())
-            if max_dim > 64:
-                factor = math.ceil(max_dim / 64)
-                icon_source = icon_source.subsample(factor, factor)
-            self._icon_image = icon_source
+            self._icon_image = get_app_icon(self)
             self.iconphoto(True, self._icon_image)
         except tk.TclError:
             self._icon_image = None
@@ -1382,15 +2020,24 @@ class MultiChannelApp(tk.Tk):
 
         self.channel_rows: List[ChannelRow] = []
         self._channel_sections: Dict[ChannelRow, CollapsibleSection] = {}
-        self.tb: Optional[MultiNBFMTx] = None
+        # Grid row/number last applied to each channel; refreshed once per
+        # idle cycle and only for channels whose position changed.
+        self._channel_positions: Dict[ChannelRow, int] = {}
+        self._channel_layout_id: Optional[str] = None
+        self.tb: Optional["MultiNBFMTx"] = None
         self.tb_thread: Optional[threading.Thread] = None
         self._run_error: Optional[Exception] = None
         self.running = False
-        self._setting_states: Dict[str, Dict[str, str]] = {}
         self._setting_errors: Dict[str, str] = {}
         self._setting_error_sources: Dict[str, str] = {}
         self.settings_status_var = tk.StringVar(value="All transmitter settings look valid.")
         self.log_messages: List[str] = []
+        self._pending_log: List[str] = []
+        self._log_flush_id: Optional[str] = None
+        # Widgets created by _build_layout; None until then so callers can
+        # test for them directly instead of probing with hasattr().
+        self.log_text: Optional[tk.Text] = None
+        self.settings_status_label: Optional[ttk.Label] = None
         self.session_path: Optional[Path] = None
 
         self._build_menu()
@@ -1398,6 +2045,8 @@ class MultiChannelApp(tk.Tk):
         self.add_channel()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         self._log("Application initialized.")
+        self.update_idletasks()
+        self.deiconify()
 
     def _compose_active_settings(self, **overrides: Optional[float]) -> Dict[str, Optional[float]]:
         settings = dict(DEFAULT_TRANSMITTER_SETTINGS)
@@ -1471,8 +2120,6 @@ class MultiChannelApp(tk.Tk):
             relief="solid",
             background="#ffecec",
         )
-        style.configure("Invalid.TEntry", fieldbackground="#ffecec")
-        style.configure("Invalid.TSpinbox", fieldbackground="#ffecec")
         padding = dict(padx=10, pady=5)
         main = ttk.Frame(self)
         main.pack(fill="both", expand=True, padx=10, pady=10)
@@ -1514,8 +2161,30 @@ class MultiChannelApp(tk.Tk):
             side="right", padx=2
         )
 
-        self.channels_container = ttk.Frame(main)
-        self.channels_container.grid(row=4, column=0, columnspan=3, sticky="nsew")
+        # Channel sections live in a frame embedded in a canvas, so only the
+        # viewport is mapped and long channel lists scroll instead of growing
+        # the window.
+        channels_view = ttk.Frame(main)
+        channels_view.grid(row=4, column=0, columnspan=3, sticky="nsew")
+        channels_view.columnconfigure(0, weight=1)
+        channels_view.rowconfigure(0, weight=1)
+        self._channels_canvas = tk.Canvas(
+            channels_view, height=360, highlightthickness=0, borderwidth=0
+        )
+        channels_scroll = ttk.Scrollbar(
+            channels_view, orient="vertical", command=self._channels_canvas.yview
+        )
+        self._channels_canvas.configure(yscrollcommand=channels_scroll.set)
+        self._channels_canvas.grid(row=0, column=0, sticky="nsew")
+        channels_scroll.grid(row=0, column=1, sticky="ns")
+        self.channels_container = ttk.Frame(self._channels_canvas)
+        self._channels_window = self._channels_canvas.create_window(
+            0, 0, window=self.channels_container, anchor="nw"
+        )
+        self.channels_container.bind("<Configure>", self._on_channels_container_configure)
+        self._channels_canvas.bind("<Configure>", self._on_channels_canvas_configure)
+        self._channels_canvas.bind("<Enter>", self._bind_channels_wheel)
+        self._channels_canvas.bind("<Leave>", self._unbind_channels_wheel)
         main.rowconfigure(4, weight=1)
 
         add_btn = ttk.Button(main, text="Add Channel", command=self.add_channel)
@@ -1569,17 +2238,50 @@ class MultiChannelApp(tk.Tk):
         main.rowconfigure(5, weight=2)
         main.rowconfigure(9, weight=1)
 
-    def add_channel(self, state: Optional[Dict[str, str]] = None) -> ChannelRow:
-        section = CollapsibleSection(self.channels_container, title="")
+    def _on_channels_container_configure(self, _event=None) -> None:
+        self._channels_canvas.configure(scrollregion=self._channels_canvas.bbox("all"))
+
+    def _on_channels_canvas_configure(self, event) -> None:
+        self._channels_canvas.itemconfigure(self._channels_window, width=event.width)
+
+    def _bind_channels_wheel(self, _event=None) -> None:
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._channels_canvas.bind_all(sequence, self._on_channels_wheel)
+
+    def _unbind_channels_wheel(self, _event=None) -> None:
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._channels_canvas.unbind_all(sequence)
+
+    def _on_channels_wheel(self, event) -> None:
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self._channels_canvas.yview_scroll(step, "units")
+
+    def add_channel(
+        self,
+        state: Optional[Dict[str, str]] = None,
+        entries: Optional[Sequence[PlaylistEntry]] = None,
+        *,
+        collapsed: bool = False,
+    ) -> ChannelRow:
+        section = CollapsibleSection(self.channels_container, title="", collapsed=collapsed)
         section.grid(row=len(self.channel_rows), column=0, sticky="we", pady=4)
-        row = ChannelRow(section.content_frame, self.presets, controller=self)
+        # Collapsed rows defer building their widgets until first expanded.
+        row = ChannelRow(
+            section.content_frame, self._preset_index, controller=self, lazy=collapsed
+        )
+        section.on_expand = row.ensure_materialized
         row.grid(row=0, column=0, sticky="we")
         self.channel_rows.append(row)
         self._channel_sections[row] = section
         self.channels_container.columnconfigure(0, weight=1)
         if state:
-            row.apply_state(state)
-        self._refresh_channel_positions()
+            row.apply_state(state, entries)
+        self._schedule_channel_layout()
         self._log(f"Added channel {len(self.channel_rows)}.")
         return row
 
@@ -1589,23 +2291,17 @@ class MultiChannelApp(tk.Tk):
                 messagebox.showwarning("Cannot remove", "At least one channel is required")
                 return
             self.channel_rows.remove(row)
-            section = getattr(self, "_channel_sections", {}).pop(row, None)
-            if section is not None:
-                section.destroy()
-            else:
-                row.destroy()
-            self._refresh_channel_positions()
+            self._channel_positions.pop(row, None)
+            self._channel_sections.pop(row).destroy()
+            self._schedule_channel_layout()
             self._log("Removed a channel.")
 
     def duplicate_channel(self, row: ChannelRow) -> None:
         if row not in self.channel_rows:
             return
         state = row.serialize_state()
-        new_row = self.add_channel(state=state)
-        # Collapse duplicated section to reduce clutter
-        section = self._channel_sections.get(new_row)
-        if section:
-            section.set_collapsed(False)
+        new_row = self.add_channel(state=state, entries=row.playlist)
+        self._channel_sections[new_row].set_collapsed(False)
         self._log("Duplicated channel configuration.")
 
     def move_channel(self, row: ChannelRow, direction: int) -> None:
@@ -1619,52 +2315,73 @@ class MultiChannelApp(tk.Tk):
             self.channel_rows[new_idx],
             self.channel_rows[idx],
         )
-        self._refresh_channel_positions()
+        # Only the two swapped channels change place; update them directly.
+        self._place_channel(idx, self.channel_rows[idx])
+        self._place_channel(new_idx, self.channel_rows[new_idx])
         self._log(f"Moved channel to position {new_idx + 1}.")
 
     def expand_all_channels(self) -> None:
         if not self._channel_sections:
             return
         for section in self._channel_sections.values():
-            if section is not None:
-                section.set_collapsed(False)
+            section.set_collapsed(False)
         self._log("Expanded all channel panels.")
 
     def collapse_all_channels(self) -> None:
         if not self._channel_sections:
             return
         for section in self._channel_sections.values():
-            if section is not None:
-                section.set_collapsed(True)
+            section.set_collapsed(True)
         self._log("Collapsed all channel panels.")
 
-    def _refresh_channel_positions(self) -> None:
+    def _schedule_channel_layout(self) -> None:
+        """Re-grid and renumber channels on the next idle cycle.
+
+        Adding, removing or moving channels in a burst (session load,
+        duplicate) therefore costs one pass instead of one per mutation.
+        """
+
+        if self._channel_layout_id is None:
+            self._channel_layout_id = self.after_idle(self._refresh_channel_layout)
+
+    def _refresh_channel_layout(self) -> None:
+        self._channel_layout_id = None
+        positions = self._channel_positions
         for idx, channel in enumerate(self.channel_rows):
-            section = getattr(self, "_channel_sections", {}).get(channel)
-            if section is not None:
-                section.grid_configure(row=idx)
-        self._refresh_channel_indices()
+            if positions.get(channel) != idx:
+                self._place_channel(idx, channel)
+
+    def _place_channel(self, idx: int, channel: ChannelRow) -> None:
+        self._channel_positions[channel] = idx
+        channel.set_index(idx + 1)
+        section = self._channel_sections[channel]
+        section.grid_configure(row=idx)
+        section.set_title(f"Channel {idx + 1}")
 
     def _clear_all_channels(self) -> None:
-        for row in list(self.channel_rows):
-            section = self._channel_sections.pop(row, None)
-            if section is not None:
-                section.destroy()
-            else:
-                row.destroy()
+        for section in self._channel_sections.values():
+            section.destroy()
         self.channel_rows.clear()
         self._channel_sections.clear()
+        self._channel_positions.clear()
 
     def _broadcast_preset_update(self) -> None:
+        index = PresetIndex.from_presets(self.presets)
+        if index == self._preset_index:
+            # Same labels, frequencies and tones: the rows are already current.
+            return
+        self._preset_index = index
         for row in self.channel_rows:
-            row.update_presets(self.presets)
+            row.update_presets(self._preset_index)
 
-    def _refresh_channel_indices(self) -> None:
-        for idx, channel in enumerate(self.channel_rows, start=1):
-            channel.set_index(idx)
-            section = getattr(self, "_channel_sections", {}).get(channel)
-            if section is not None:
-                section.set_title(f"Channel {idx}")
+    def _show_channel_error(self, exc: ChannelValidationError) -> None:
+        if not 0 < exc.channel_index <= len(self.channel_rows):
+            return
+        row = self.channel_rows[exc.channel_index - 1]
+        # Expand (and so materialize) the row before showing the message so
+        # it is visible on a channel that was collapsed.
+        self._channel_sections[row].set_collapsed(False)
+        row.show_error(str(exc))
 
     def _clear_channel_errors(self) -> None:
         for row in self.channel_rows:
@@ -1699,7 +2416,8 @@ class MultiChannelApp(tk.Tk):
                     idx, "CTCSS and DCS cannot be enabled at the same time"
                 )
 
-            file_groups.append(list(files))
+            # get_playlist_paths() already returns a fresh list.
+            file_groups.append(files)
             freqs.append(freq)
             gains.append(gain)
             ctcss_tones.append(tone)
@@ -1712,59 +2430,7 @@ class MultiChannelApp(tk.Tk):
 
         return center_freq, file_groups, frequency_offsets, gains, ctcss_tones, dcs_codes
 
-    def _register_numeric_validator(
-        self,
-        *,
-        field_name: str,
-        display_name: str,
-        var: tk.StringVar,
-        widget,
-        allow_empty: bool = False,
-        minimum: Optional[float] = None,
-        maximum: Optional[float] = None,
-    ) -> None:
-        default_style = widget.cget("style") or widget.winfo_class()
-        error_style = f"Invalid.{widget.winfo_class()}"
-        self._setting_states[field_name] = {
-            "widget": widget,
-            "default_style": default_style,
-            "error_style": error_style,
-        }
-
-        def _validate(*_ignored):
-            text = var.get().strip()
-            if not text:
-                if allow_empty:
-                    self._clear_setting_error(field_name)
-                    return
-                self._mark_setting_error(field_name, f"{display_name} is required.")
-                return
-            try:
-                value = float(text)
-            except ValueError:
-                self._mark_setting_error(field_name, f"{display_name} must be numeric.")
-                return
-            if minimum is not None and value < minimum:
-                self._mark_setting_error(
-                    field_name,
-                    f"{display_name} must be ≥ {minimum:g}.",
-                )
-                return
-            if maximum is not None and value > maximum:
-                self._mark_setting_error(
-                    field_name,
-                    f"{display_name} must be ≤ {maximum:g}.",
-                )
-                return
-            self._clear_setting_error(field_name)
-
-        var.trace_add("write", _validate)
-        _validate()
-
     def _mark_setting_error(self, field_name: str, message: str, *, source: str = "base") -> None:
-        state = self._setting_states.get(field_name)
-        if state:
-            state["widget"].configure(style=state["error_style"])
         self._setting_errors[field_name] = message
         self._setting_error_sources[field_name] = source
         self._update_settings_status()
@@ -1783,7 +2449,8 @@ class MultiChannelApp(tk.Tk):
             return
         updated_settings = dict(dialog.result)
         try:
-            save_transmitter_settings(updated_settings, self._settings_path)
+            # An explicit save from the dialog must survive a crash mid-write.
+            save_transmitter_settings(updated_settings, self._settings_path, atomic=True)
         except Exception as exc:  # pragma: no cover - UI feedback
             messagebox.showerror("Save failed", str(exc))
             return
@@ -1793,78 +2460,101 @@ class MultiChannelApp(tk.Tk):
 
     def import_presets_from_file(self) -> None:
         filename = filedialog.askopenfilename(
+            parent=self,
             title="Import preset CSV",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
         )
         if not filename:
             return
+        path = Path(filename)
         try:
-            presets = load_presets_from_csv(Path(filename))
+            presets = load_presets_from_csv(path)
         except Exception as exc:
             messagebox.showerror("Import failed", str(exc))
             return
         self.presets = presets
         self._broadcast_preset_update()
-        self._log(f"Loaded presets from {Path(filename).name}.")
+        self._log(f"Loaded presets from {path.name}.")
 
     def export_presets_to_file(self) -> None:
         if not self.presets:
             messagebox.showinfo("No presets", "There are no presets to export.")
             return
         filename = filedialog.asksaveasfilename(
+            parent=self,
             title="Export preset CSV",
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
         )
         if not filename:
             return
+        path = Path(filename)
         try:
-            save_presets_to_csv(self.presets, Path(filename))
+            save_presets_to_csv(self.presets, path)
         except Exception as exc:
             messagebox.showerror("Export failed", str(exc))
             return
-        self._log(f"Exported presets to {Path(filename).name}.")
+        self._log(f"Exported presets to {path.name}.")
 
     def save_session(self) -> None:
         filename = filedialog.asksaveasfilename(
+            parent=self,
             title="Save session",
             defaultextension=".json",
             filetypes=[("Session files", "*.json"), ("All files", "*.*")],
         )
         if not filename:
             return
-        data = self._serialize_session()
+        path = Path(filename)
+        payload = _json_dumps(self._serialize_session())
         try:
-            with open(filename, "w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            with replace_on_close(path, binary=True) as handle:
+                handle.write(payload)
         except OSError as exc:
             messagebox.showerror("Save failed", str(exc))
             return
-        self.session_path = Path(filename)
+        self.session_path = path
         self._log(f"Saved session to {self.session_path.name}.")
 
     def load_session(self) -> None:
         filename = filedialog.askopenfilename(
+            parent=self,
             title="Load session",
             filetypes=[("Session files", "*.json"), ("All files", "*.*")],
         )
         if not filename:
             return
-        try:
-            with open(filename, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except OSError as exc:
-            messagebox.showerror("Load failed", str(exc))
+        path = Path(filename)
+
+        # Read and decode off the Tk thread so a large session file does not
+        # freeze the window; the widgets are only touched back on the main loop.
+        # Every failure is handed back too (undecodable bytes, deep nesting),
+        # since an exception escaping here would end the thread silently.
+        def _read():
+            try:
+                data = _json_loads(path.read_bytes())
+            except Exception as exc:
+                self.after(0, self._on_session_read, path, None, exc)
+            else:
+                self.after(0, self._on_session_read, path, data, None)
+
+        threading.Thread(target=_read, daemon=True).start()
+
+    def _on_session_read(
+        self, path: Path, data: Any, error: Optional[Exception]
+    ) -> None:
+        if isinstance(error, json.JSONDecodeError):
+            messagebox.showerror("Load failed", f"Invalid JSON: {error}")
             return
-        except json.JSONDecodeError as exc:
-            messagebox.showerror("Load failed", f"Invalid JSON: {exc}")
+        if error is not None:
+            messagebox.showerror("Load failed", str(error))
             return
         try:
             self._apply_session(data)
         except Exception as exc:
             messagebox.showerror("Load failed", str(exc))
             return
-        self.session_path = Path(filename)
+        self.session_path = path
         self._log(f"Loaded session from {self.session_path.name}.")
 
     def export_hackrf_bundle(self) -> None:
@@ -1879,8 +2569,7 @@ class MultiChannelApp(tk.Tk):
                 dcs_codes,
             ) = self._collect_channel_data()
         except ChannelValidationError as exc:
-            if 0 < exc.channel_index <= len(self.channel_rows):
-                self.channel_rows[exc.channel_index - 1].show_error(str(exc))
+            self._show_channel_error(exc)
             self.status_var.set(f"Channel {exc.channel_index}: {exc}")
             self.bell()
             return
@@ -1907,17 +2596,19 @@ class MultiChannelApp(tk.Tk):
             return
 
         destination = filedialog.askdirectory(
+            parent=self,
             title="Choose export folder for HackRF SD card"
         )
         if not destination:
             return
 
-        channels: List[HackRFExportChannel] = []
+        hackrf_export = _get_export_module()
+        channels: List["HackRFExportChannel"] = []
         for idx, (files, offset, gain, ctcss, dcs) in enumerate(
             zip(file_groups, offsets, gains, ctcss_tones, dcs_codes), start=1
         ):
             channels.append(
-                HackRFExportChannel(
+                hackrf_export.HackRFExportChannel(
                     index=idx,
                     frequency_hz=center_freq + offset,
                     gain=gain,
@@ -1928,7 +2619,7 @@ class MultiChannelApp(tk.Tk):
             )
 
         try:
-            manifest_path = export_hackrf_package(
+            manifest_path = hackrf_export.export_hackrf_package(
                 Path(destination),
                 channels,
                 center_frequency_hz=center_freq,
@@ -1958,7 +2649,10 @@ class MultiChannelApp(tk.Tk):
         return {
             "version": 1,
             "settings": self._gather_settings(),
-            "channels": [row.serialize_state() for row in self.channel_rows],
+            "channels": [
+                dict(row.serialize_state(), collapsed=self._channel_sections[row].collapsed)
+                for row in self.channel_rows
+            ],
             "presets": presets_to_rows(self.presets),
         }
 
@@ -1989,9 +2683,19 @@ class MultiChannelApp(tk.Tk):
         channels = data.get("channels")
         if isinstance(channels, list) and channels:
             self._clear_all_channels()
-            for channel_state in channels:
-                if isinstance(channel_state, dict):
-                    self.add_channel(channel_state)
+            states = [state for state in channels if isinstance(state, dict)]
+            # Probe every row's files in one batch rather than row by row.
+            playlists = [[Path(p) for p in state.get("playlist", [])] for state in states]
+            entries = iter(create_playlist_entries([p for paths in playlists for p in paths]))
+            # Channels come back expanded or collapsed as they were saved
+            # (older sessions: all expanded); collapsed ones build their
+            # widgets when the operator first expands them.
+            for state, paths in zip(states, playlists):
+                self.add_channel(
+                    state,
+                    [next(entries) for _ in paths],
+                    collapsed=bool(state.get("collapsed", False)),
+                )
         else:
             if not self.channel_rows:
                 self.add_channel()
@@ -2028,9 +2732,6 @@ class MultiChannelApp(tk.Tk):
                 var.set(str(value))
 
     def _clear_setting_error(self, field_name: str) -> None:
-        state = self._setting_states.get(field_name)
-        if state:
-            state["widget"].configure(style=state["default_style"])
         self._setting_errors.pop(field_name, None)
         self._setting_error_sources.pop(field_name, None)
         self._update_settings_status()
@@ -2039,11 +2740,11 @@ class MultiChannelApp(tk.Tk):
         if self._setting_errors:
             message = next(iter(self._setting_errors.values()))
             self.settings_status_var.set(message)
-            if hasattr(self, "settings_status_label"):
+            if self.settings_status_label is not None:
                 self.settings_status_label.config(foreground="#a40000")
         else:
             self.settings_status_var.set("All transmitter settings look valid.")
-            if hasattr(self, "settings_status_label"):
+            if self.settings_status_label is not None:
                 self.settings_status_label.config(foreground="#1f6f00")
 
     def _safe_float(self, text: str) -> Optional[float]:
@@ -2081,14 +2782,16 @@ class MultiChannelApp(tk.Tk):
         positive: bool = False,
         optional: bool = False,
     ) -> Optional[float]:
-        text = var.get().strip()
-        if not text:
-            if optional:
-                return None
-            raise ValueError(f"{field_name} is required")
+        text = var.get()
         try:
+            # float() already ignores surrounding whitespace, so the common
+            # well-formed case needs no strip() copy.
             value = float(text)
         except ValueError as exc:
+            if not text.strip():
+                if optional:
+                    return None
+                raise ValueError(f"{field_name} is required") from None
             raise ValueError(f"{field_name} must be a valid number") from exc
         if positive and value <= 0:
             raise ValueError(f"{field_name} must be positive")
@@ -2169,8 +2872,7 @@ class MultiChannelApp(tk.Tk):
                 dcs_codes,
             ) = self._collect_channel_data()
         except ChannelValidationError as exc:
-            if 0 < exc.channel_index <= len(self.channel_rows):
-                self.channel_rows[exc.channel_index - 1].show_error(str(exc))
+            self._show_channel_error(exc)
             self.status_var.set(f"Channel {exc.channel_index}: {exc}")
             self.bell()
             return
@@ -2198,14 +2900,16 @@ class MultiChannelApp(tk.Tk):
             messagebox.showerror("Invalid configuration", str(exc))
             return
 
+        device = self.device_var.get()
+        loop_queue = bool(self.loop_var.get())
         audio_sr = None
         if tx_gain_override is not None:
             tx_gain = float(tx_gain_override)
         else:
-            tx_gain = self.TX_GAIN_DEFAULTS.get(self.device_var.get(), 0.0)
+            tx_gain = self.TX_GAIN_DEFAULTS.get(device, 0.0)
 
-        self.tb = MultiNBFMTx(
-            device=self.device_var.get(),
+        self.tb = _get_tx_module().MultiNBFMTx(
+            device=device,
             center_freq=center_freq,
             file_groups=file_groups,
             offsets=offsets,
@@ -2215,7 +2919,7 @@ class MultiChannelApp(tk.Tk):
             mod_sr=mod_sr,
             audio_sr=audio_sr,
             master_scale=master_scale,
-            loop_queue=self.loop_var.get(),
+            loop_queue=loop_queue,
             channel_gains=gains,
             ctcss_tones=ctcss_tones,
             ctcss_level=ctcss_level,
@@ -2304,11 +3008,23 @@ class MultiChannelApp(tk.Tk):
         timestamp = time.strftime("%H:%M:%S")
         entry = f"[{timestamp}] {message}"
         self.log_messages.append(entry)
-        if hasattr(self, "log_text"):
-            self.log_text.configure(state="normal")
-            self.log_text.insert(tk.END, entry + "\n")
-            self.log_text.see(tk.END)
-            self.log_text.configure(state="disabled")
+        if self.log_text is not None:
+            # Coalesce bursts of messages into one widget update per idle
+            # cycle instead of reconfiguring and scrolling once per line.
+            self._pending_log.append(entry)
+            if self._log_flush_id is None:
+                self._log_flush_id = self.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_id = None
+        if not self._pending_log:
+            return
+        text = "\n".join(self._pending_log) + "\n"
+        self._pending_log.clear()
+        self.log_text.configure(state="normal")
+        self.log_text.insert(tk.END, text)
+        self.log_text.see(tk.END)
+        self.log_text.configure(state="disabled")
 
 
 def main() -> None:
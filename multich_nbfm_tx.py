@@ -32,6 +32,7 @@ import re
 import time
 import wave
 from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Sequence
 
@@ -45,14 +46,28 @@ import osmosdr
 from gnuradio import analog, blocks, filter, gr
 from gnuradio.filter import firdes, window
 
-
-DEFAULT_GATE_OPEN_THRESHOLD = 0.015
-DEFAULT_GATE_CLOSE_THRESHOLD = 0.014
-DEFAULT_GATE_ATTACK_MS = 4.0
-DEFAULT_GATE_RELEASE_MS = 200.0
+from gate_defaults import (
+    DEFAULT_GATE_ATTACK_MS,
+    DEFAULT_GATE_CLOSE_THRESHOLD,
+    DEFAULT_GATE_OPEN_THRESHOLD,
+    DEFAULT_GATE_RELEASE_MS,
+)
 
 _IP_KV_RE = re.compile(r"(?:^|[,\s])(?:ip|addr|hostname)=(?P<value>[^,\s]+)")
 _IP_COLON_RE = re.compile(r"ip:(?P<value>[^,\s]+)")
+PLUTO_DEVICES = frozenset({"pluto", "plutoplus", "pluto+", "plutoplussdr"})
+
+
+@lru_cache(maxsize=None)
+def _low_pass_taps(sample_rate: float, cutoff: float, transition: float):
+    """Return unity-gain Hamming low-pass taps, designed once per parameter set.
+
+    Every channel shares the same sample rates, so without the cache an
+    N-channel graph would redesign identical filters N times. Callers must
+    treat the returned taps as read-only.
+    """
+
+    return firdes.low_pass(1.0, sample_rate, cutoff, transition, window.WIN_HAMMING)
 
 
 class QueuedAudioSource(gr.sync_block):
@@ -87,6 +102,7 @@ class QueuedAudioSource(gr.sync_block):
         self._file_sample_rate: Optional[int] = None
         self._ratecv_state = None
         self._pending: np.ndarray = np.empty(0, dtype=np.float32)
+        self._convert_buffer: np.ndarray = np.empty(0, dtype=np.float32)
         self.sample_rate: Optional[int] = (
             int(target_sample_rate) if target_sample_rate is not None else None
         )
@@ -253,7 +269,14 @@ class QueuedAudioSource(gr.sync_block):
                 self._ratecv_state,
             )
 
-        data = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        # Scale straight into a reused float32 buffer. work() drains the
+        # previous chunk from _pending before asking for another, so the
+        # buffer is never overwritten while still referenced.
+        samples = np.frombuffer(raw, dtype=np.int16)
+        if self._convert_buffer.size < samples.size:
+            self._convert_buffer = np.empty(samples.size, dtype=np.float32)
+        data = self._convert_buffer[: samples.size]
+        np.multiply(samples, np.float32(1.0 / 32768.0), out=data)
         return data
 
     def work(self, input_items, output_items):
@@ -568,7 +591,7 @@ class NBFMChannel(gr.hier_block2):
         # gentle filter to reduce wideband noise while still passing the
         # sub-audible tone generators without noticeable attenuation.
         self.a_lpf = filter.fir_filter_fff(
-            1, firdes.low_pass(1.0, audio_sr, 3400, 800, window.WIN_HAMMING)
+            1, _low_pass_taps(audio_sr, 3400, 800)
         )
 
         self.connect(self.src, self.program_gain, self.a_lpf)
@@ -619,14 +642,14 @@ class NBFMChannel(gr.hier_block2):
         if len(mix_sources) == 1:
             mixed_audio = mix_sources[0]
         else:
-            current = mix_sources[0]
-            for tone_src in mix_sources[1:]:
-                adder = blocks.add_ff()
-                self._mix_adders.append(adder)
-                self.connect(current, (adder, 0))
-                self.connect(tone_src, (adder, 1))
-                current = adder
-            mixed_audio = current
+            # add_ff accepts any number of inputs, so one block sums program
+            # audio and every tone in a single pass instead of a chain of
+            # two-input adders each copying the full stream.
+            adder = blocks.add_ff()
+            self._mix_adders.append(adder)
+            for port, mix_src in enumerate(mix_sources):
+                self.connect(mix_src, (adder, port))
+            mixed_audio = adder
 
         # Frequency modulator sensitivity:
         # sensitivity [rad/sample] = 2*pi*deviation / mod_sr
@@ -653,7 +676,7 @@ class NBFMChannel(gr.hier_block2):
         # For NBFM (±3–5 kHz dev, ~3 kHz audio), Carson ≈ 2*(fd+fa) ~ 12–16 kHz.
         # Keep a little margin; 15–20 kHz cutoff:
         self.bb_lpf = filter.fir_filter_ccf(
-            1, firdes.low_pass(1.0, mod_sr, 20000, 5000, window.WIN_HAMMING)
+            1, _low_pass_taps(mod_sr, 20000, 5000)
         )
 
         # Shift to desired offset at mod_sr
@@ -867,14 +890,13 @@ class MultiNBFMTx(gr.top_block):
         if len(self.channels) == 1:
             self.summer = self.channels[0]
         else:
-            last = self.channels[0]
-            for ch in self.channels[1:]:
-                adder = blocks.add_cc()
-                self._adders.append(adder)
-                self.connect(last, (adder, 0))
-                self.connect(ch, (adder, 1))
-                last = adder
-            self.summer = last
+            # One N-input add_cc sums every channel in a single VOLK loop
+            # rather than N-1 chained adders with their own buffers.
+            adder = blocks.add_cc()
+            self._adders.append(adder)
+            for port, ch in enumerate(self.channels):
+                self.connect(ch, (adder, port))
+            self.summer = adder
 
         # Master scaling so composite never clips SDR
         if gains_list is None:
@@ -1015,6 +1037,20 @@ def _normalize_ip_target(target: str) -> str:
         return target
 
 
+def resolve_device_args(
+    device: str, device_args: Optional[str], pluto_ip: Optional[str]
+) -> Optional[str]:
+    """Return the osmosdr device string implied by ``--device-args``/``--pluto-ip``."""
+
+    if device_args and pluto_ip:
+        raise ValueError("--device-args and --pluto-ip cannot be used together")
+    if pluto_ip:
+        if device.lower() not in PLUTO_DEVICES:
+            raise ValueError("--pluto-ip is only valid with --device pluto or plutoplus")
+        return f"pluto=ip:{pluto_ip}"
+    return device_args
+
+
 def parse_args():
     p = argparse.ArgumentParser(
         description="Multi-channel NBFM transmitter for HackRF, Pluto, and PlutoPlus"
@@ -1248,12 +1284,10 @@ def parse_args():
     if args.gate_release_ms < 0:
         p.error("--gate-release-ms must be non-negative")
 
-    if args.device_args and args.pluto_ip:
-        p.error("--device-args and --pluto-ip cannot be used together")
-    if args.pluto_ip:
-        if args.device.lower() not in {"pluto", "plutoplus", "pluto+", "plutoplussdr"}:
-            p.error("--pluto-ip is only valid with --device pluto or plutoplus")
-        args.device_args = f"pluto=ip:{args.pluto_ip}"
+    try:
+        args.device_args = resolve_device_args(args.device, args.device_args, args.pluto_ip)
+    except ValueError as exc:
+        p.error(str(exc))
 
     return args
 
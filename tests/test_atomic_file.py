@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from atomic_file import replace_on_close
+
+
+def test_replace_on_close_swaps_in_new_content(tmp_path: Path):
+    target = tmp_path / "out.csv"
+    target.write_text("old\n", encoding="utf-8")
+
+    with replace_on_close(target, newline="") as handle:
+        handle.write("new\n")
+
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.csv"]
+
+
+def test_replace_on_close_uses_unique_temp_names(tmp_path: Path):
+    target = tmp_path / "manifest.json"
+
+    with replace_on_close(target, binary=True) as first:
+        with replace_on_close(target, binary=True) as second:
+            assert first.name != second.name
+            second.write(b"inner")
+        first.write(b"outer")
+
+    assert target.read_bytes() == b"outer"
+
+
+def test_replace_on_close_keeps_original_on_failure(tmp_path: Path):
+    target = tmp_path / "settings.json"
+    target.write_bytes(b"good")
+
+    with pytest.raises(RuntimeError):
+        with replace_on_close(target, binary=True) as handle:
+            handle.write(b"partial")
+            raise RuntimeError("boom")
+
+    assert target.read_bytes() == b"good"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["settings.json"]
+
+
+def test_replace_on_close_preserves_permissions(tmp_path: Path):
+    existing = tmp_path / "report.csv"
+    existing.write_text("old\n", encoding="utf-8")
+    existing.chmod(0o640)
+    with replace_on_close(existing, newline="") as handle:
+        handle.write("new\n")
+    assert existing.stat().st_mode & 0o777 == 0o640
+
+    fresh = tmp_path / "fresh.csv"
+    plain = tmp_path / "plain.csv"
+    plain.write_text("x", encoding="utf-8")
+    with replace_on_close(fresh, newline="") as handle:
+        handle.write("x")
+    assert fresh.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
@@ -1,4 +1,5 @@
 import csv
+import os
 import subprocess
 import sys
 import wave
@@ -10,7 +11,8 @@ import pytest
 if not hasattr(np, "isscalar"):
     np.isscalar = lambda obj: isinstance(obj, (int, float, bool))
 
-from audio_activity_report import analyze_audio_file, discover_audio_files
+import audio_activity_report
+from audio_activity_report import analyze_audio_file, discover_audio_files, generate_report
 
 
 def _write_wav(path: Path, sample_rate: int, samples: np.ndarray) -> None:
@@ -38,6 +40,50 @@ def test_analyze_audio_file_reports_duty_cycle(tmp_path):
     assert abs(summary.duty_cycle_percent - 50.0) <= 0.1
 
 
+def test_large_wav_is_streamed_with_same_result(tmp_path, monkeypatch):
+    sr = 8000
+    samples = np.concatenate(
+        [np.zeros(sr // 2, dtype=np.float32), np.full(sr // 2 + 13, 0.5, dtype=np.float32)]
+    )
+    wav_path = tmp_path / "capture.wav"
+    _write_wav(wav_path, sr, samples)
+    whole = analyze_audio_file(wav_path, threshold=0.1, chunk_ms=7.0)
+
+    def no_whole_read(*_args):
+        raise AssertionError("large file was read whole")
+
+    monkeypatch.setattr(audio_activity_report, "_WHOLE_FILE_MAX_BYTES", 0)
+    monkeypatch.setattr(audio_activity_report, "_read_wav_samples", no_whole_read)
+    streamed = analyze_audio_file(wav_path, threshold=0.1, chunk_ms=7.0)
+
+    assert streamed == whole
+
+
+def test_generate_report_parallel_matches_serial(tmp_path):
+    sr = 8000
+    for index, level in enumerate((0.0, 0.2, 0.5)):
+        samples = np.concatenate(
+            [np.zeros(sr // 4, dtype=np.float32), np.full(sr // 4 * (index + 1), level, dtype=np.float32)]
+        )
+        _write_wav(tmp_path / f"clip{index}.wav", sr, samples)
+
+    serial = generate_report([tmp_path], threshold=0.1, chunk_ms=10.0, recursive=False, jobs=1)
+    parallel = generate_report([tmp_path], threshold=0.1, chunk_ms=10.0, recursive=False, jobs=2)
+
+    assert [row.path.name for row in serial] == ["clip0.wav", "clip1.wav", "clip2.wav"]
+    assert parallel == serial
+
+
+def test_generate_report_skips_truncated_files(tmp_path):
+    (tmp_path / "empty.wav").write_bytes(b"")
+    (tmp_path / "stub.mp3").write_bytes(b"ID3")
+    _write_wav(tmp_path / "clip.wav", 8000, np.zeros(800, dtype=np.float32))
+
+    rows = generate_report([tmp_path], threshold=0.1, chunk_ms=10.0, recursive=False, jobs=1)
+
+    assert [row.path.name for row in rows] == ["clip.wav"]
+
+
 def test_discover_audio_files_filters_supported_types(tmp_path):
     wav_path = tmp_path / "a.wav"
     wav_path.write_bytes(b"RIFF")
@@ -54,6 +100,42 @@ def test_discover_audio_files_filters_supported_types(tmp_path):
     assert set(discovered) == {wav_path.resolve(), mp3_path.resolve(), nested_wav.resolve()}
 
 
+def test_discover_audio_files_skips_unreadable_directories(tmp_path):
+    wav_path = tmp_path / "a.wav"
+    wav_path.write_bytes(b"RIFF")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "hidden.wav").write_bytes(b"RIFF")
+    locked.chmod(0o000)
+    try:
+        if os.access(locked, os.R_OK):
+            pytest.skip("directory permissions are not enforced for this user")
+        discovered = discover_audio_files([tmp_path], recursive=True)
+    finally:
+        locked.chmod(0o755)
+
+    assert discovered == [wav_path.resolve()]
+
+
+def test_discover_audio_files_skips_directories_scandir_rejects(tmp_path, monkeypatch):
+    wav_path = tmp_path / "a.wav"
+    wav_path.write_bytes(b"RIFF")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "hidden.wav").write_bytes(b"RIFF")
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    assert discover_audio_files([tmp_path], recursive=True) == [wav_path.resolve()]
+    assert discover_audio_files([locked], recursive=True) == []
+
+
 def test_cli_defaults_write_csv_to_default_path(tmp_path):
     script = Path(__file__).resolve().parents[1] / "audio_activity_report.py"
     wav_path = tmp_path / "clip.wav"
@@ -78,3 +160,19 @@ def test_cli_defaults_write_csv_to_default_path(tmp_path):
         rows = list(reader)
 
     assert rows and rows[0]["path"] == str(wav_path.resolve())
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2"])
+def test_cli_rejects_non_positive_jobs(tmp_path, jobs):
+    script = Path(__file__).resolve().parents[1] / "audio_activity_report.py"
+
+    result = subprocess.run(
+        [sys.executable, str(script), "--jobs", jobs, str(tmp_path)],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 2
+    assert "--jobs: must be at least 1" in result.stderr
+    assert not (tmp_path / "audio_duty_cycle.csv").exists()
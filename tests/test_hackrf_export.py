@@ -1,7 +1,11 @@
 import json
 import csv
+import os
 from pathlib import Path
 
+import pytest
+
+import hackrf_export
 from hackrf_export import HackRFExportChannel, export_hackrf_package
 
 
@@ -72,3 +76,84 @@ def test_export_copies_audio_once_and_builds_manifests(tmp_path: Path):
     assert len(rows) == 2
     assert "voice2.wav" in rows[0]["files"]
     assert rows[1]["dcs_code"] == "023N"
+
+
+def test_reexport_reuses_identical_copies(tmp_path: Path):
+    source = _touch_file(tmp_path / "sources" / "voice1.wav")
+    dest = tmp_path / "export"
+    channels = [
+        HackRFExportChannel(index=1, frequency_hz=462_562_500.0, gain=1.0, playlist=[source])
+    ]
+    settings = dict(
+        center_frequency_hz=462_562_500.0,
+        tx_sample_rate=8_000_000,
+        mod_sample_rate=250_000,
+        deviation_hz=3_000,
+        master_scale=0.6,
+        loop_queue=True,
+    )
+
+    export_hackrf_package(dest, channels, **settings)
+    manifest_path = export_hackrf_package(dest, channels, **settings)
+
+    assert sorted(p.name for p in (dest / "audio").iterdir()) == ["voice1.wav"]
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["channels"][0]["files"] == ["audio/voice1.wav"]
+
+    source.write_bytes(b"changed content")
+    export_hackrf_package(dest, channels, **settings)
+
+    assert sorted(p.name for p in (dest / "audio").iterdir()) == ["voice1.wav", "voice1_2.wav"]
+
+
+def test_reexport_does_not_reuse_copy_with_same_size_and_mtime(tmp_path: Path):
+    first = _touch_file(tmp_path / "take1" / "voice1.wav", b"AAAA")
+    second = _touch_file(tmp_path / "take2" / "voice1.wav", b"BBBB")
+    stamp = first.stat().st_mtime_ns
+    os.utime(second, ns=(stamp, stamp))
+    dest = tmp_path / "export"
+    settings = dict(
+        center_frequency_hz=462_562_500.0,
+        tx_sample_rate=8_000_000,
+        mod_sample_rate=250_000,
+        deviation_hz=3_000,
+        master_scale=0.6,
+        loop_queue=True,
+    )
+
+    export_hackrf_package(
+        dest,
+        [HackRFExportChannel(index=1, frequency_hz=462_562_500.0, gain=1.0, playlist=[first])],
+        **settings,
+    )
+    manifest_path = export_hackrf_package(
+        dest,
+        [HackRFExportChannel(index=1, frequency_hz=462_562_500.0, gain=1.0, playlist=[second])],
+        **settings,
+    )
+
+    manifest = json.loads(manifest_path.read_text())
+    (exported,) = manifest["channels"][0]["files"]
+    assert (dest / exported).read_bytes() == b"BBBB"
+    assert (dest / "audio" / "voice1.wav").read_bytes() == b"AAAA"
+
+
+def test_kernel_copy_falls_back_when_primitive_copies_nothing(tmp_path: Path, monkeypatch):
+    src = _touch_file(tmp_path / "src.wav", b"payload")
+    dst = tmp_path / "dst.wav"
+    monkeypatch.setattr(hackrf_export, "_copy_file_range", lambda *args: 0)
+    monkeypatch.setattr(hackrf_export, "_sendfile", lambda *args: 0)
+
+    hackrf_export._fast_copy(src, dst)
+
+    assert dst.read_bytes() == b"payload"
+
+
+def test_kernel_copy_rejects_short_copy(tmp_path: Path, monkeypatch):
+    src = _touch_file(tmp_path / "src.wav", b"payload")
+    dst = tmp_path / "dst.wav"
+    results = iter([3, 0])
+    monkeypatch.setattr(hackrf_export, "_copy_file_range", lambda *args: next(results))
+
+    with pytest.raises(OSError, match="short kernel copy"):
+        hackrf_export._fast_copy(src, dst)
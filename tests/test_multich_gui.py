@@ -0,0 +1,193 @@
+import math
+import os
+import threading
+import types
+import wave
+from pathlib import Path
+
+import pytest
+
+import multich_gui
+
+
+def _write_wav(path: Path, rate: int = 8000, frames: int = 4000) -> Path:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(b"\0\0" * frames)
+    return path
+
+
+def test_playlist_entries_fall_back_when_uring_batch_fails(tmp_path: Path, monkeypatch):
+    exited = []
+
+    def submit_and_wait(ring, count):
+        raise OSError("io_uring_enter failed")
+
+    fake = types.SimpleNamespace(
+        O_RDONLY=0,
+        Ring=object,
+        Cqe=object,
+        io_uring_queue_init=lambda depth, ring: None,
+        io_uring_queue_exit=exited.append,
+        io_uring_get_sqe=lambda ring: types.SimpleNamespace(),
+        io_uring_prep_open=lambda sqe, path, flags: None,
+        io_uring_submit_and_wait=submit_and_wait,
+    )
+    monkeypatch.setattr(multich_gui, "liburing", fake)
+    monkeypatch.setattr(multich_gui, "_URING_UNAVAILABLE", False)
+
+    paths = [
+        _write_wav(tmp_path / "one.wav"),
+        _write_wav(tmp_path / "two.wav", rate=16000, frames=16000),
+    ]
+
+    entries = multich_gui.create_playlist_entries(paths)
+
+    assert [entry.path for entry in entries] == paths
+    assert [(entry.duration, entry.sample_rate) for entry in entries] == [
+        (0.5, 8000),
+        (1.0, 16000),
+    ]
+    assert len(exited) == 1
+
+
+def test_uring_probe_only_closes_fds_the_ring_did_not(tmp_path: Path, monkeypatch):
+    real_close = os.close
+    pending = []
+    submitted = []
+    ring_closed = []
+
+    def get_sqe(_ring):
+        sqe = types.SimpleNamespace()
+        pending.append(sqe)
+        return sqe
+
+    def submit_and_wait(_ring, _count):
+        submitted.extend(pending)
+        pending.clear()
+
+    def wait_cqe(_ring, cqe):
+        sqe = submitted.pop(0)
+        kind, *args = sqe.op
+        if kind == "open":
+            res = os.open(args[0], os.O_RDONLY)
+        elif kind == "read":
+            fd, buf = args
+            data = os.pread(fd, len(buf), 0)
+            buf[: len(data)] = data
+            res = len(data)
+        else:
+            if ring_closed:
+                raise OSError("ring died mid-close")
+            real_close(args[0])
+            ring_closed.append(args[0])
+            res = 0
+        cqe[0] = types.SimpleNamespace(res=res, user_data=sqe.user_data)
+
+    fake = types.SimpleNamespace(
+        O_RDONLY=os.O_RDONLY,
+        Ring=object,
+        Cqe=lambda: [None],
+        io_uring_queue_init=lambda depth, ring: None,
+        io_uring_queue_exit=lambda ring: None,
+        io_uring_get_sqe=get_sqe,
+        io_uring_prep_open=lambda sqe, path, flags: setattr(sqe, "op", ("open", path)),
+        io_uring_prep_read=lambda sqe, fd, buf, offset: setattr(sqe, "op", ("read", fd, buf)),
+        io_uring_prep_close=lambda sqe, fd: setattr(sqe, "op", ("close", fd)),
+        io_uring_submit_and_wait=submit_and_wait,
+        io_uring_wait_cqe=wait_cqe,
+        io_uring_cqe_seen=lambda ring, cqe: None,
+    )
+    monkeypatch.setattr(multich_gui, "liburing", fake)
+    monkeypatch.setattr(multich_gui, "_URING_UNAVAILABLE", False)
+    closed_again = []
+
+    def close(fd):
+        closed_again.append(fd)
+        real_close(fd)
+
+    paths = [_write_wav(tmp_path / "one.wav"), _write_wav(tmp_path / "two.wav")]
+    monkeypatch.setattr(os, "close", close)
+    try:
+        result = multich_gui._probe_wav_headers_uring(paths)
+    finally:
+        monkeypatch.setattr(os, "close", real_close)
+
+    assert result is None
+    assert len(ring_closed) == 1
+    assert len(closed_again) == 1
+    assert closed_again[0] not in ring_closed
+
+
+def test_save_transmitter_settings_rejects_non_finite_values(tmp_path: Path):
+    path = tmp_path / "transmitter_settings.json"
+    settings = dict(multich_gui.DEFAULT_TRANSMITTER_SETTINGS)
+    multich_gui.save_transmitter_settings(settings, path)
+    saved = path.read_bytes()
+
+    settings["gate_attack_ms"] = math.nan
+    with pytest.raises(ValueError, match="gate_attack_ms"):
+        multich_gui.save_transmitter_settings(settings, path)
+
+    assert path.read_bytes() == saved
+    assert multich_gui.load_transmitter_settings(path) == multich_gui.DEFAULT_TRANSMITTER_SETTINGS
+
+
+def test_load_presets_ignores_extra_fields_past_missing_columns(tmp_path: Path):
+    path = tmp_path / "presets.csv"
+    path.write_text(
+        "channel_id,display_name,frequency_hz\nA,Alpha,462562500,023N\n",
+        encoding="utf-8",
+    )
+
+    (preset,) = multich_gui.load_presets_from_csv(path)
+
+    assert (preset.key, preset.label, preset.frequency_hz) == ("A", "Alpha", 462562500.0)
+    assert preset.ctcss_hz is None
+    assert preset.dcs_code is None
+
+
+def test_load_session_reports_unexpected_read_errors(tmp_path: Path, monkeypatch):
+    path = tmp_path / "session.json"
+    path.write_bytes(b"[]")
+    monkeypatch.setattr(multich_gui.filedialog, "askopenfilename", lambda **_kw: str(path))
+
+    def deep_json(_raw):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(multich_gui, "_json_loads", deep_json)
+    delivered = []
+    done = threading.Event()
+
+    def after(_delay, callback, *args):
+        delivered.append((callback, args))
+        done.set()
+
+    app = types.SimpleNamespace(after=after, _on_session_read=object())
+
+    multich_gui.MultiChannelApp.load_session(app)
+
+    assert done.wait(5)
+    ((callback, (read_path, data, error)),) = delivered
+    assert callback is app._on_session_read
+    assert (read_path, data) == (path, None)
+    assert isinstance(error, RecursionError)
+
+
+def test_apply_session_restores_saved_expand_state():
+    added = []
+    app = types.SimpleNamespace(
+        channel_rows=[],
+        _clear_all_channels=lambda: None,
+        add_channel=lambda state, entries, *, collapsed: added.append(collapsed),
+    )
+
+    multich_gui.MultiChannelApp._apply_session(
+        app,
+        {"channels": [{"gain": "1.0"}, {"gain": "1.0", "collapsed": True}, {"gain": "1.0"}]},
+    )
+
+    # Sessions saved before expand state was recorded open every channel.
+    assert added == [False, True, False]